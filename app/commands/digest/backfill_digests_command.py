@@ -3,16 +3,22 @@ from typing import List, Optional, NamedTuple, cast
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import pytz  # type: ignore
-from app.models.digest import Digest
 from app.services.digest_generation_config_service import DigestGenerationConfigService
+from app.services.digest_service import DigestService
 from app.commands.digest.generate_draft_digest_command import GenerateDraftDigestCommand
+from app.utils.date_filter import calculate_digest_date_range
 from crontab import CronTab  # type: ignore
 
 
 class BackfillResult(NamedTuple):
-    """Result of backfill operation."""
+    """Result of backfill operation.
 
-    created_digests: List[Digest]
+    Only the ids of the created digests are kept so large backfills don't hold
+    on to every generated Digest instance.
+    """
+
+    created_ids: List[UUID]
+    created_count: int
     skipped_count: int
     failed_count: int
     deleted_count: int
@@ -21,9 +27,12 @@ class BackfillResult(NamedTuple):
 class BackfillDigestsCommand:
     """Command to backfill digests for a digest generation config over a specified number of days."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, digest_service: Optional[DigestService] = None):
         self.db = db
         self.digest_generation_config_service = DigestGenerationConfigService(db)
+        self.digest_service = (
+            digest_service if digest_service is not None else DigestService(db)
+        )
         self.generate_draft_digest_command = GenerateDraftDigestCommand(db)
 
     def execute(
@@ -40,7 +49,7 @@ class BackfillDigestsCommand:
         :param days: Number of days to backfill digests for.
         :param start_from_date: Date to start backfilling from (defaults to now).
         :param force: If True, delete existing overlapping digests and create new ones (defaults to False).
-        :return: BackfillResult with created digests, skipped count, failed count, and deleted count.
+        :return: BackfillResult with created digest ids and count, skipped count, failed count, and deleted count.
         """
 
         digest_generation_config = (
@@ -84,7 +93,8 @@ class BackfillDigestsCommand:
             cron, start_from_date_tz, days
         )
 
-        created_digests = []
+        created_ids: List[UUID] = []
+        created_count = 0
         skipped_count = 0
         failed_count = 0
         deleted_count = 0
@@ -104,7 +114,9 @@ class BackfillDigestsCommand:
                         digest_generation_config_id, execution_time
                     )
                     if digest:
-                        created_digests.append(digest)
+                        created_count += 1
+                        if digest.id:
+                            created_ids.append(cast(UUID, digest.id))
                         print(
                             f"Created digest for {execution_time.strftime('%Y-%m-%d %H:%M:%S %Z')} (forced)"
                         )
@@ -121,7 +133,9 @@ class BackfillDigestsCommand:
                         digest_generation_config_id, execution_time
                     )
                     if digest:
-                        created_digests.append(digest)
+                        created_count += 1
+                        if digest.id:
+                            created_ids.append(cast(UUID, digest.id))
                         print(
                             f"Created digest for {execution_time.strftime('%Y-%m-%d %H:%M:%S %Z')}"
                         )
@@ -144,7 +158,8 @@ class BackfillDigestsCommand:
                 continue
 
         return BackfillResult(
-            created_digests=created_digests,
+            created_ids=created_ids,
+            created_count=created_count,
             skipped_count=skipped_count,
             failed_count=failed_count,
             deleted_count=deleted_count,
@@ -254,12 +269,6 @@ class BackfillDigestsCommand:
         :param execution_time: The execution time to check.
         :return: Number of digests deleted.
         """
-        # Import here to avoid circular imports
-        from app.utils.date_filter import calculate_digest_date_range
-        from app.services.digest_service import DigestService
-
-        digest_service = DigestService(self.db)
-
         # Get the digest generation config to access cron expression and timezone
         config = self.digest_generation_config_service.get_digest_generation_config(
             digest_generation_config_id
@@ -276,7 +285,7 @@ class BackfillDigestsCommand:
         )
 
         # Find all digests that overlap with this time period
-        existing_digests = digest_service.get_digests_by_config(
+        existing_digests = self.digest_service.get_digests_by_config(
             digest_generation_config_id
         )
 
@@ -296,7 +305,7 @@ class BackfillDigestsCommand:
                 if digest_from <= to_date and digest_to >= from_date:
                     # Delete the overlapping digest
                     if digest.id:
-                        digest_service.delete_digest(cast(UUID, digest.id))
+                        self.digest_service.delete_digest(cast(UUID, digest.id))
                         deleted_count += 1
                         print(
                             f"Deleted existing digest for period {digest_from.strftime('%Y-%m-%d %H:%M:%S %Z')} to {digest_to.strftime('%Y-%m-%d %H:%M:%S %Z')}"
@@ -315,12 +324,6 @@ class BackfillDigestsCommand:
         :param execution_time: The execution time to check.
         :return: True if a digest already exists for this time period.
         """
-        # Import here to avoid circular imports
-        from app.utils.date_filter import calculate_digest_date_range
-        from app.services.digest_service import DigestService
-
-        digest_service = DigestService(self.db)
-
         # Get the digest generation config to access cron expression and timezone
         config = self.digest_generation_config_service.get_digest_generation_config(
             digest_generation_config_id
@@ -337,7 +340,7 @@ class BackfillDigestsCommand:
         )
 
         # Check if any digest exists for this config with overlapping date range
-        existing_digests = digest_service.get_digests_by_config(
+        existing_digests = self.digest_service.get_digests_by_config(
             digest_generation_config_id
         )
 
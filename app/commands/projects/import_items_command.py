@@ -1,10 +1,9 @@
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.models.project import Project
 from app.models.import_request import ImportRequest
-from app.models.import_request_item import ImportRequestItem
 from app.schemas.project_import import (
     ImportItemRequest,
     ImportItemData,
@@ -25,6 +24,10 @@ class ImportItemsCommand:
         self.db = db
         self.source_service = SourceService(db)
         self.import_request_service = ImportRequestService(db)
+        # Source ids keyed by (workspace_id, identifier), so repeated executes
+        # for the same source skip the lookup. The command lives for a single
+        # request and session, so entries can't go stale across sessions.
+        self._source_ids: Dict[Tuple[UUID, str], UUID] = {}
 
     def execute(
         self,
@@ -42,15 +45,13 @@ class ImportItemsCommand:
         """
         # Create or get the source for this import
         # source_identifier = f"import_{project.id}"
-        source = self.source_service.get_or_create_source_by_identifier(
-            identifier=slugify(import_request.source),
-            workspace_id=project.workspace_id,
-            name=import_request.source.capitalize(),
+        source_id = self._get_or_create_source_id(
+            project.workspace_id, import_request.source
         )
 
         # Create the import request
         import_request_data = ImportRequestCreate(
-            source_id=source.id,
+            source_id=source_id,
             requested_by_id=requested_by_id,
             status=ImportRequestStatuses.PENDING,
             received_count=len(import_request.items),
@@ -64,13 +65,18 @@ class ImportItemsCommand:
             import_request_data
         )
 
-        # Process each item
-        # TODO: We could insert all the items in a bulk insert instead of one by one
-        for item_data in import_request.items:
-            # Create import request item with raw payload
-            self._create_import_request_item(
-                db_import_request, source, item_data, ImportItemStatuses.PENDING
-            )
+        # Insert all the items in a single statement
+        self.import_request_service.create_import_request_items(
+            [
+                self._build_import_request_item(
+                    db_import_request,
+                    source_id,
+                    item_data,
+                    ImportItemStatuses.PENDING,
+                )
+                for item_data in import_request.items
+            ]
+        )
 
         return {
             "id": str(db_import_request.id),
@@ -81,22 +87,32 @@ class ImportItemsCommand:
             "status": ImportRequestStatuses.PENDING,
         }
 
-    def _create_import_request_item(
+    def _get_or_create_source_id(self, workspace_id: UUID, source: str) -> UUID:
+        """Get (or create) the id of the workspace source an import comes from."""
+        identifier = slugify(source)
+        key = (workspace_id, identifier)
+        source_id = self._source_ids.get(key)
+        if source_id is None:
+            source_id = self.source_service.get_or_create_source_by_identifier(
+                identifier=identifier,
+                workspace_id=workspace_id,
+                name=source.capitalize(),
+            ).id
+            self._source_ids[key] = source_id
+        return source_id
+
+    def _build_import_request_item(
         self,
         import_request: ImportRequest,
-        source,
+        source_id: UUID,
         item_data: ImportItemData,
         status: str,
-    ) -> ImportRequestItem:
-        """Create an import request item."""
-        import_item_create = ImportRequestItemCreate(
+    ) -> ImportRequestItemCreate:
+        """Build the data for an import request item."""
+        return ImportRequestItemCreate(
             import_request_id=import_request.id,
-            source_id=source.id,
+            source_id=source_id,
             source_item_id=item_data.author.id,  # Use the author's ID as source_item_id
             raw_payload=item_data.model_dump(),  # Store the full item data
             status=status,
         )
-
-        return self.import_request_service.create_import_request_item(
-            import_item_create
-        )
@@ -50,6 +50,9 @@ class Settings(BaseSettings):
     redis_namespace: str = Field(
         default="llama_index", json_schema_extra={"env": "REDIS_NAMESPACE"}
     )
+    celery_io_queue_enabled: bool = Field(
+        default=False, json_schema_extra={"env": "CELERY_IO_QUEUE_ENABLED"}
+    )
     service_account_client_id: str = Field(
         default="", json_schema_extra={"env": "SERVICE_ACCOUNT_CLIENT_ID"}
     )
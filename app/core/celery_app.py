@@ -6,13 +6,28 @@ settings = get_settings()
 
 celery_app = Celery("chrona-worker")
 
+# Queue for the I/O bound tasks (database and HTTP heavy). It can be consumed by
+# a dedicated worker running a green pool (needs `poetry install --with green`):
+#   CELERY_POOL=eventlet CELERY_QUEUES=chrona_io poetry run worker
+# Tasks are only routed to it when CELERY_IO_QUEUE_ENABLED is set, which must
+# wait until workers consume chrona_io (see docs/workers.md).
+IO_QUEUE = "chrona_io"
+
+task_routes = {}
+if settings.celery_io_queue_enabled:
+    task_routes.update(
+        {
+            "app.tasks.process_import_items.*": {"queue": IO_QUEUE},
+            "app.tasks.backfill_digests.*": {"queue": IO_QUEUE},
+        }
+    )
+task_routes["app.tasks.*"] = {"queue": "chrona"}  # Route all app.tasks.* to chrona
+
 celery_app.conf.update(
     broker_url=f"redis://{settings.redis_host}:{settings.redis_port}/0",
     result_backend=f"redis://{settings.redis_host}:{settings.redis_port}/0",
     task_default_queue="chrona",  # Use dedicated queue for chrona tasks
-    task_routes={
-        "app.tasks.*": {"queue": "chrona"},  # Route all app.tasks.* to chrona queue
-    },
+    task_routes=task_routes,
 )
 
 # Optional configuration
@@ -22,19 +37,8 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    result_expires=3600,  # Backfill results are polled shortly after enqueueing
+    result_compression="gzip",  # Backfill results list every created digest id
 )
 
 celery_app.autodiscover_tasks(["app.tasks"])  # ensure tasks are registered explicitly
-
-# # Explicitly register tasks to ensure they're available
-# def register_tasks():
-#     """Explicitly import tasks to ensure registration."""
-#     try:
-#         from app.tasks.process_import_items import process_import_items  # noqa: F401
-#         from app.tasks.backfill_digests import backfill_digests_task  # noqa: F401
-#         print(f"✅ Tasks registered: process_import_items, backfill_digests_task")
-#     except ImportError as e:
-#         print(f"⚠️  Warning: Could not import tasks: {e}")
-
-# # Register tasks when this module is imported
-# register_tasks()
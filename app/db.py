@@ -1,3 +1,6 @@
+import json
+
+import orjson
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import (
     sessionmaker,
@@ -10,10 +13,36 @@ from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 
 settings = get_settings()
 
+
+def json_serializer(value) -> str:
+    """
+    Serialize JSON/JSONB column values with orjson.
+
+    Values orjson rejects (integers over 64 bits, and datetimes, which are
+    passed through so they still fail as with the stdlib) fall back to
+    json.dumps. Unlike json.dumps, NaN and Infinity are written as null and
+    UUIDs, dataclasses and numpy values are serialized instead of raising.
+    """
+    try:
+        return orjson.dumps(
+            value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        ).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(value)
+
+
+# Engine options for (de)serializing JSON/JSONB columns, such as the raw
+# payloads of import request items, shared with the test engine.
+JSON_ENGINE_OPTIONS = {
+    "json_serializer": json_serializer,
+    "json_deserializer": orjson.loads,
+}
+
 engine = create_engine(
     settings.database_url,
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
+    **JSON_ENGINE_OPTIONS,
 )
 
 SQLAlchemyInstrumentor().instrument(
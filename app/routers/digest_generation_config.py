@@ -226,11 +226,6 @@ def backfill_digests_async(
     logger = get_logger()
 
     try:
-        # Convert start_from_date to ISO string if provided
-        start_date_str = None
-        if backfill_request.start_from_date:
-            start_date_str = backfill_request.start_from_date.isoformat()
-
         logger.info(
             f"Starting backfill task for {digest_generation_config.id} with {backfill_request.days} days"
         )
@@ -238,7 +233,7 @@ def backfill_digests_async(
         task = backfill_digests_task.delay(
             digest_generation_config_id=str(digest_generation_config.id),
             days=backfill_request.days,
-            start_from_date=start_date_str,
+            start_from_timestamp=backfill_request.start_from_timestamp,
             force=backfill_request.force,
         )
 
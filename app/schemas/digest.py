@@ -1,7 +1,7 @@
 from typing import Optional, Dict, Any, List, TYPE_CHECKING
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
-from datetime import datetime
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from datetime import datetime, timezone
 from app.constants.digest_constants import DigestStatuses
 
 if TYPE_CHECKING:
@@ -135,6 +135,21 @@ class DigestBackfillRequest(BaseModel):
         description="If True, generate digests even if they already exist",
     )
 
+    @field_validator("start_from_date")
+    @classmethod
+    def ensure_start_from_date_is_aware(cls, v):
+        """Treat naive start dates as UTC, as the backfill command does."""
+        if v is not None and v.tzinfo is None:
+            return v.replace(tzinfo=timezone.utc)
+        return v
+
+    @property
+    def start_from_timestamp(self) -> Optional[float]:
+        """POSIX timestamp of start_from_date, as passed to the backfill task."""
+        if self.start_from_date is None:
+            return None
+        return self.start_from_date.timestamp()
+
 
 class DigestWithEntries(Digest):
     """Schema for digest response with entries included."""
@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models.entry import Entry
@@ -127,6 +128,14 @@ class EntryService(SoftDeleteService[Entry]):
             .first()
         )
 
+    def count_entries_by_external_id(self, project_id: UUID, external_id: str) -> int:
+        """Count the entries of a project that have the given external ID."""
+        return (
+            self.db.query(func.count(Entry.id))
+            .filter(Entry.project_id == project_id, Entry.external_id == external_id)
+            .scalar()
+        )
+
     def _process_date_range_filters(self, filters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process DateRangeFilter objects in filters dict and convert them to operator-based filters.
@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.entry_update import EntryUpdate
@@ -97,6 +98,32 @@ class EntryUpdateService(SoftDeleteService[EntryUpdate]):
             .first()
         )
 
+    def get_entry_updates_by_external_ids(
+        self, source_id: UUID, external_ids: List[str]
+    ) -> List[EntryUpdate]:
+        """Get the entry updates of a source whose external ID is in the given list."""
+        return (
+            self.db.query(EntryUpdate)
+            .filter(
+                EntryUpdate.source_id == source_id,
+                EntryUpdate.external_id.in_(external_ids),
+            )
+            .all()
+        )
+
+    def count_entry_updates_by_external_ids(
+        self, source_id: UUID, external_ids: List[str]
+    ) -> int:
+        """Count the entry updates of a source whose external ID is in the given list."""
+        return (
+            self.db.query(func.count(EntryUpdate.id))
+            .filter(
+                EntryUpdate.source_id == source_id,
+                EntryUpdate.external_id.in_(external_ids),
+            )
+            .scalar()
+        )
+
     def search(self, filters: Dict[str, Any]) -> List[EntryUpdateSchema]:
         query = self.db.query(EntryUpdate).options(
             joinedload(EntryUpdate.source_author).selectinload(SourceAuthor.author),
@@ -1,6 +1,10 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
-from uuid import UUID
-from sqlalchemy import desc
+from uuid import UUID, uuid4
+from sqlalchemy import desc, insert
 from sqlalchemy.orm import Session, joinedload
 from app.models.import_request import ImportRequest
 from app.models.import_request_item import ImportRequestItem
@@ -21,6 +25,10 @@ Module providing the ImportRequestService class for managing ImportRequest entit
 Includes methods for CRUD operations and dynamic searching with flexible filters.
 """
 
+# Above this many items, create_import_request_items loads the rows with
+# COPY ... FROM STDIN instead of a multi-row INSERT (PostgreSQL only).
+COPY_THRESHOLD = 500
+
 
 class ImportRequestService(SoftDeleteService[ImportRequest]):
     def __init__(self, db: Session):
@@ -39,6 +47,17 @@ class ImportRequestService(SoftDeleteService[ImportRequest]):
 
         return query.filter(ImportRequest.id == import_request_id).first()
 
+    def get_import_request_with_project(
+        self, import_request_id: UUID
+    ) -> Optional[ImportRequest]:
+        """Get a single import request by ID with its project loaded in the same query."""
+        return (
+            self.db.query(ImportRequest)
+            .options(joinedload(ImportRequest.project))
+            .filter(ImportRequest.id == import_request_id)
+            .first()
+        )
+
     def get_import_requests(
         self, skip: int = 0, limit: int = 100
     ) -> List[ImportRequest]:
@@ -172,6 +191,70 @@ class ImportRequestService(SoftDeleteService[ImportRequest]):
         self.db.refresh(db_import_request_item)
         return db_import_request_item
 
+    def create_import_request_items(
+        self, import_request_items: List[ImportRequestItemCreate]
+    ) -> int:
+        """
+        Create many import request items at once.
+
+        Items are inserted with a single multi-row INSERT, or streamed with
+        COPY on PostgreSQL when there are more than COPY_THRESHOLD of them.
+        Returns the number of items created.
+        """
+        if not import_request_items:
+            return 0
+
+        if (
+            len(import_request_items) > COPY_THRESHOLD
+            and self.db.get_bind().dialect.name == "postgresql"
+        ):
+            self._copy_import_request_items(import_request_items)
+        else:
+            # No RETURNING is requested, so dialects without insertmanyvalues
+            # support fall back to a plain DBAPI executemany() rather than one
+            # INSERT per row; this is the same path bulk_insert_mappings uses.
+            self.db.execute(
+                insert(ImportRequestItem),
+                [item.model_dump() for item in import_request_items],
+            )
+        self.db.commit()
+        return len(import_request_items)
+
+    def _copy_import_request_items(
+        self, import_request_items: List[ImportRequestItemCreate]
+    ) -> None:
+        """Load import request items with COPY ... FROM STDIN (CSV format)."""
+        now = datetime.now(timezone.utc).isoformat()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for item in import_request_items:
+            writer.writerow(
+                [
+                    uuid4(),
+                    item.import_request_id,
+                    item.source_id,
+                    item.source_item_id,
+                    item.status,
+                    json.dumps(item.raw_payload or {}),
+                    now,
+                    now,
+                ]
+            )
+        buffer.seek(0)
+
+        # Run COPY on the session's own connection so it joins its transaction
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                "COPY import_request_items "
+                "(id, import_request_id, source_id, source_item_id, status, "
+                "raw_payload, created_at, updated_at) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
     def update_import_request_item(
         self, item_id: UUID, import_request_item: ImportRequestItemUpdate
     ) -> Optional[ImportRequestItem]:
@@ -249,6 +332,4 @@ class ImportRequestService(SoftDeleteService[ImportRequest]):
 
     def _get_current_timestamp(self):
         """Get current timestamp for soft delete operations."""
-        from datetime import datetime, timezone
-
         return datetime.now(timezone.utc)
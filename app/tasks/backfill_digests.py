@@ -1,6 +1,8 @@
 from uuid import UUID
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
 
 from app.db import SessionLocal
 from app.core.celery_app import celery_app
@@ -8,14 +10,82 @@ from app.core.celery_app import celery_app
 # Import heavy dependencies only when task executes (lazy loading)
 from app.commands.digest.backfill_digests_command import BackfillDigestsCommand
 from app.core.logging_config import get_logger
+from app.utils.uuid_utils import is_valid_uuid
+
+
+def _backfill_digests(
+    db: Session,
+    digest_generation_config_id: str,
+    days: int,
+    start_from_timestamp: Optional[float] = None,
+    force: bool = False,
+    start_from_date: Optional[str] = None,
+) -> dict:
+    """
+    Run the backfill command for a single digest generation config.
+
+    Shared by backfill_digests_task and backfill_digests_bulk_task.
+    start_from_date is the ISO string argument taken before
+    start_from_timestamp; it is still accepted for messages enqueued by the
+    previous release and will be removed in the next one.
+    """
+    logger = get_logger("chrona.tasks.backfill_digests")
+
+    # Convert string ID to UUID with validation
+    if not is_valid_uuid(digest_generation_config_id):
+        raise ValueError(
+            f"Invalid digest_generation_config_id format: {digest_generation_config_id}. Must be a valid UUID."
+        )
+    config_id = UUID(digest_generation_config_id)
+
+    # start_from_timestamp is already normalized to a POSIX timestamp at enqueue time
+    parsed_start_date = None
+    if start_from_timestamp is not None:
+        parsed_start_date = datetime.fromtimestamp(
+            start_from_timestamp, tz=timezone.utc
+        )
+    elif start_from_date:
+        try:
+            parsed_start_date = datetime.fromisoformat(
+                start_from_date.replace("Z", "+00:00")
+            )
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid start_from_date format: {start_from_date}. Must be ISO format."
+            ) from e
+        # Naive dates are UTC, as in DigestBackfillRequest
+        if parsed_start_date.tzinfo is None:
+            parsed_start_date = parsed_start_date.replace(tzinfo=timezone.utc)
+        parsed_start_date = parsed_start_date.astimezone(timezone.utc)
+
+    logger.info(f"Parsed start date: {parsed_start_date}")
+    # Execute the backfill command
+    command = BackfillDigestsCommand(db)
+    logger.info(f"Executing backfill command for {config_id} with {days} days")
+    result = command.execute(
+        digest_generation_config_id=config_id,
+        days=days,
+        start_from_date=parsed_start_date,
+        force=force,
+    )
+    logger.info(f"Backfill command result: {result}")
+    # Return serializable result
+    return {
+        "created_count": result.created_count,
+        "skipped_count": result.skipped_count,
+        "failed_count": result.failed_count,
+        "deleted_count": result.deleted_count,
+        "digest_ids": [str(digest_id) for digest_id in result.created_ids],
+    }
 
 
 @celery_app.task
 def backfill_digests_task(
     digest_generation_config_id: str,
     days: int,
-    start_from_date: Optional[str] = None,
+    start_from_timestamp: Optional[float] = None,
     force: bool = False,
+    start_from_date: Optional[str] = None,
 ) -> dict:
     """
     Backfill digests for a digest generation config.
@@ -24,8 +94,10 @@ def backfill_digests_task(
     Args:
         digest_generation_config_id: UUID string of the digest generation config
         days: Number of days to backfill
-        start_from_date: Optional ISO format datetime string to start from
+        start_from_timestamp: Optional POSIX timestamp (UTC) to start from
         force: Whether to force generation even if digests exists
+        start_from_date: Deprecated ISO format datetime string to start from,
+            only accepted for messages enqueued by the previous release
 
     Returns:
         dict: Contains created_count, skipped_count, failed_count, deleted_count
@@ -37,51 +109,62 @@ def backfill_digests_task(
     db = SessionLocal()
     try:
         try:
-            # Convert string ID to UUID with validation
-            try:
-                config_id = UUID(digest_generation_config_id)
-            except ValueError as e:
-                raise ValueError(
-                    f"Invalid digest_generation_config_id format: {digest_generation_config_id}. Must be a valid UUID."
-                ) from e
-
-            # Parse start_from_date if provided
-            parsed_start_date = None
-            if start_from_date:
-                try:
-                    parsed_start_date = datetime.fromisoformat(
-                        start_from_date.replace("Z", "+00:00")
-                    )
-                except ValueError as e:
-                    raise ValueError(
-                        f"Invalid start_from_date format: {start_from_date}. Must be ISO format."
-                    ) from e
-
-            logger.info(f"Parsed start date: {parsed_start_date}")
-            # Execute the backfill command
-            command = BackfillDigestsCommand(db)
-            logger.info(f"Executing backfill command for {config_id} with {days} days")
-            result = command.execute(
-                digest_generation_config_id=config_id,
+            return _backfill_digests(
+                db,
+                digest_generation_config_id=digest_generation_config_id,
                 days=days,
-                start_from_date=parsed_start_date,
+                start_from_timestamp=start_from_timestamp,
                 force=force,
+                start_from_date=start_from_date,
             )
-            logger.info(f"Backfill command result: {result}")
-            # Return serializable result
-            return {
-                "created_count": len(result.created_digests),
-                "skipped_count": result.skipped_count,
-                "failed_count": result.failed_count,
-                "deleted_count": result.deleted_count,
-                "digest_ids": [
-                    str(digest.id) for digest in result.created_digests if digest.id
-                ],
-            }
-
         except Exception as e:
             raise RuntimeError(f"Failed to backfill digests: {str(e)}")
         finally:
             db.commit()
     finally:
         db.close()
+
+
+@celery_app.task
+def backfill_digests_bulk_task(configs: List[dict]) -> List[dict]:
+    """
+    Backfill digests for several digest generation configs in one task.
+
+    Prefer this over enqueuing one backfill_digests_task per config: a single
+    broker message is published and acknowledged for the whole batch.
+
+    Args:
+        configs: List of dicts with the same keys as backfill_digests_task
+            arguments (digest_generation_config_id, days and optionally
+            start_from_timestamp and force)
+
+    Returns:
+        list: One entry per config, in order. Each entry is the result dict of
+        backfill_digests_task, or ``{"digest_generation_config_id": ..., "error": ...}``
+        when that config failed.
+    """
+    logger = get_logger("chrona.tasks.backfill_digests")
+    logger.info(f"Starting bulk backfill task for {len(configs)} configs")
+    results = []
+    db = SessionLocal()
+    try:
+        for config in configs:
+            try:
+                results.append(_backfill_digests(db, **config))
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(
+                    f"Failed to backfill digests for {config.get('digest_generation_config_id')}: {str(e)}"
+                )
+                results.append(
+                    {
+                        "digest_generation_config_id": config.get(
+                            "digest_generation_config_id"
+                        ),
+                        "error": str(e),
+                    }
+                )
+        return results
+    finally:
+        db.close()
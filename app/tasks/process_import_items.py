@@ -1,5 +1,8 @@
+from typing import Iterable, List
 from uuid import UUID
 
+from celery import group
+
 from app.db import SessionLocal
 from app.core.celery_app import celery_app
 from app.commands.projects.process_import_request_command import (
@@ -7,47 +10,49 @@ from app.commands.projects.process_import_request_command import (
 )
 from app.services.import_request_service import ImportRequestService
 from app.core.logging_config import get_logger
+from app.utils.uuid_utils import is_valid_uuid
+
+# Number of import requests packed into a single broker message by
+# enqueue_import_items_bulk.
+BULK_CHUNK_SIZE = 100
 
 
-@celery_app.task
+# Nothing polls this task's result, so skip the result backend write.
+@celery_app.task(ignore_result=True, acks_late=False)
 def process_import_items(import_request_id: str) -> None:
     """
     Process import items for a given import request.
     This is an async task that runs in the background.
     """
-    # Debug: Print to stdout to ensure we can see something
-    print(f"DEBUG: Task started for import request {import_request_id}")
-
     logger = get_logger("chrona.tasks.process_import_items")
-    print(f"DEBUG: Logger created: {logger}")
-    print(f"DEBUG: Logger level: {logger.level}")
-    print(f"DEBUG: Logger handlers: {logger.handlers}")
-    print(f"DEBUG: Logger propagate: {logger.propagate}")
-
-    logger.info(f"Processing import items for import request {import_request_id}")
-    print("DEBUG: Logger.info called")
+    logger.info("Processing import items for import request %s", import_request_id)
     db = SessionLocal()
     try:
         try:
-            logger.info(f"Getting import request {import_request_id}")
             # Convert string ID to UUID
+            if not is_valid_uuid(import_request_id):
+                raise ValueError(
+                    f"Invalid import_request_id format: {import_request_id}. Must be a valid UUID."
+                )
             request_id = UUID(import_request_id)
 
             # Get import request to find associated project
             import_request_service = ImportRequestService(db)
-            import_request = import_request_service.get_import_request(request_id)
+            import_request = import_request_service.get_import_request_with_project(
+                request_id
+            )
 
             if not import_request:
                 raise RuntimeError(f"Import request {import_request_id} not found")
 
-            logger.info(f"Getting project {import_request.project_id}")
+            logger.debug("Getting project %s", import_request.project_id)
             # Get the project from the import request relationship
             project = import_request.project
 
             if not project:
                 raise RuntimeError(f"Project {import_request.project_id} not found")
 
-            logger.info(f"Processing import request {import_request_id}")
+            logger.debug("Processing import request %s", import_request_id)
             # Process the import request
             command = ProcessImportRequestCommand(db)
             command.execute(request_id, project)
@@ -58,3 +63,45 @@ def process_import_items(import_request_id: str) -> None:
             db.commit()
     finally:
         db.close()
+
+
+# Nothing polls this task's result either; failures are logged per request.
+@celery_app.task(ignore_result=True, acks_late=False)
+def process_import_items_chunk(import_request_ids: List[str]) -> None:
+    """
+    Process several import requests from a single broker message.
+
+    Each import request is processed as process_import_items would, but a
+    failing request is logged and does not stop the rest of the chunk.
+    """
+    logger = get_logger("chrona.tasks.process_import_items")
+    for import_request_id in import_request_ids:
+        try:
+            process_import_items(import_request_id)
+        except Exception as e:
+            logger.error(
+                "Failed to process import request %s: %s", import_request_id, e
+            )
+
+
+def enqueue_import_items_bulk(
+    import_request_ids: Iterable[str], chunk_size: int = BULK_CHUNK_SIZE
+):
+    """
+    Enqueue process_import_items for many import requests at once.
+
+    Instead of publishing one broker message per import request (as
+    ``process_import_items.delay`` does), the ids are split into chunks of
+    ``chunk_size`` and each chunk is published as a single
+    process_import_items_chunk message. A failing import request is logged
+    and the others in its chunk are still processed.
+
+    :param import_request_ids: Import request ids (as strings) to process.
+    :param chunk_size: Number of import requests per broker message.
+    :return: The GroupResult of the published chunks.
+    """
+    ids = [str(import_request_id) for import_request_id in import_request_ids]
+    return group(
+        process_import_items_chunk.s(ids[start : start + chunk_size])
+        for start in range(0, len(ids), chunk_size)
+    ).apply_async()
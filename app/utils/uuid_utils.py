@@ -0,0 +1,25 @@
+"""
+Utility functions for validating UUID strings received from task payloads and requests.
+"""
+
+import re
+
+UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+
+
+def is_valid_uuid(value: str) -> bool:
+    """
+    Check whether a string is a canonical (hyphenated) UUID.
+
+    This is a cheap pre-check that avoids raising and catching ValueError from
+    ``UUID(...)`` for malformed input.
+
+    Args:
+        value: The string to check
+
+    Returns:
+        True if the string is a canonical UUID, False otherwise
+    """
+    return len(value) == 36 and UUID_RE.match(value) is not None
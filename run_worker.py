@@ -1,21 +1,73 @@
 import os
 import sys
 
-from app.core.celery_app import celery_app
+# Pools that run tasks on green threads instead of forked processes. Their
+# dependencies live in the optional "green" Poetry group:
+#   poetry install --with green
+#   CELERY_POOL=eventlet CELERY_QUEUES=chrona_io poetry run worker
+GREEN_POOLS = ("eventlet", "gevent")
+
+
+def _default_pool() -> str:
+    # macOS often hits fork-related segfaults with the default prefork pool
+    return "solo" if sys.platform == "darwin" else "prefork"
+
+
+def _monkey_patch(pool: str) -> None:
+    """
+    Patch the standard library (and psycopg2) for green pools.
+
+    This has to run before anything else imports sockets, threads or the
+    database driver, otherwise blocking calls would stall every green thread
+    of the worker instead of yielding.
+    """
+    try:
+        if pool == "eventlet":
+            import eventlet  # type: ignore
+            from psycogreen.eventlet import patch_psycopg  # type: ignore
+        else:
+            from gevent import monkey  # type: ignore
+            from psycogreen.gevent import patch_psycopg  # type: ignore
+    except ImportError as e:
+        raise SystemExit(
+            f"CELERY_POOL={pool} requires the optional green worker dependencies "
+            f"({e.name} is not installed). Install them with: "
+            "poetry install --with green"
+        ) from e
+
+    if pool == "eventlet":
+        eventlet.monkey_patch()
+    else:
+        monkey.patch_all()
+
+    patch_psycopg()
+
+
+POOL = os.getenv("CELERY_POOL", _default_pool())
+
+if POOL in GREEN_POOLS:
+    _monkey_patch(POOL)
+
+from app.core.celery_app import IO_QUEUE, celery_app  # noqa: E402
 
 
 def main():
     loglevel = os.getenv("CELERY_LOGLEVEL", "info")
-    # macOS often hits fork-related segfaults with the default prefork pool
-    default_pool = "solo" if sys.platform == "darwin" else "prefork"
-    pool = os.getenv("CELERY_POOL", default_pool)
-    concurrency = os.getenv("CELERY_CONCURRENCY", "1" if pool == "solo" else "4")
-    queues = os.getenv("CELERY_QUEUES", "chrona")  # Default to chrona queue
+    # Green pools are meant for the I/O bound tasks on IO_QUEUE, where most of
+    # the time is spent waiting on the database, so they run many more slots.
+    if POOL == "solo":
+        default_concurrency = "1"
+    elif POOL in GREEN_POOLS:
+        default_concurrency = "18"
+    else:
+        default_concurrency = "4"
+    concurrency = os.getenv("CELERY_CONCURRENCY", default_concurrency)
+    queues = os.getenv("CELERY_QUEUES", f"chrona,{IO_QUEUE}")
 
     argv = [
         "worker",
         f"--loglevel={loglevel}",
-        f"--pool={pool}",
+        f"--pool={POOL}",
         f"--concurrency={concurrency}",
         f"--queues={queues}",  # Always specify queues
     ]
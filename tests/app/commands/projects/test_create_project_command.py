@@ -6,13 +6,17 @@ from app.constants.membership import PROJECT_MEMBER_ROLE
 
 
 class TestCreateProjectCommand:
-    """Test cases for CreateProjectCommand."""
+    """Test cases for CreateProjectCommand.
 
-    def test_create_project_success(self, db, setup_user, setup_workspace, faker):
+    The user and workspace are only read by the command, so they are created
+    once per module; each test's projects and memberships are rolled back.
+    """
+
+    def test_create_project_success(self, db, module_user, module_workspace, faker):
         """Test successfully creating a project with project membership."""
         # Arrange
-        user = setup_user
-        workspace = setup_workspace
+        user = module_user
+        workspace = module_workspace
         project_data = ProjectCreate(
             name=faker.catch_phrase(),
             description=faker.text(100),
@@ -47,12 +51,12 @@ class TestCreateProjectCommand:
         assert membership.project_id == project.id
 
     def test_create_project_without_description(
-        self, db, setup_user, setup_workspace, faker
+        self, db, module_user, module_workspace, faker
     ):
         """Test creating a project without a description."""
         # Arrange
-        user = setup_user
-        workspace = setup_workspace
+        user = module_user
+        workspace = module_workspace
         project_data = ProjectCreate(
             name=faker.catch_phrase(),
             workspace_id=workspace.id,
@@ -81,12 +85,12 @@ class TestCreateProjectCommand:
         assert membership.role == PROJECT_MEMBER_ROLE
 
     def test_create_project_without_labels(
-        self, db, setup_user, setup_workspace, faker
+        self, db, module_user, module_workspace, faker
     ):
         """Test creating a project without labels."""
         # Arrange
-        user = setup_user
-        workspace = setup_workspace
+        user = module_user
+        workspace = module_workspace
         project_data = ProjectCreate(
             name=faker.catch_phrase(),
             description=faker.text(100),
@@ -116,10 +120,10 @@ class TestCreateProjectCommand:
         assert membership is not None
         assert membership.role == PROJECT_MEMBER_ROLE
 
-    def test_create_project_without_workspace_id(self, db, setup_user, faker):
+    def test_create_project_without_workspace_id(self, db, module_user, faker):
         """Test creating a project without workspace_id raises error."""
         # Arrange
-        user = setup_user
+        user = module_user
         project_data = ProjectCreate(
             name=faker.catch_phrase(),
             description=faker.text(100),
@@ -134,10 +138,10 @@ class TestCreateProjectCommand:
         except ValueError as e:
             assert "Workspace ID is required" in str(e)
 
-    def test_create_project_with_nonexistent_workspace(self, db, setup_user, faker):
+    def test_create_project_with_nonexistent_workspace(self, db, module_user, faker):
         """Test creating a project with non-existent workspace raises error."""
         # Arrange
-        user = setup_user
+        user = module_user
         project_data = ProjectCreate(
             name=faker.catch_phrase(),
             description=faker.text(100),
@@ -154,12 +158,12 @@ class TestCreateProjectCommand:
             assert "not found" in str(e)
 
     def test_create_multiple_projects_same_user(
-        self, db, setup_user, setup_workspace, faker
+        self, db, module_user, module_workspace, faker
     ):
         """Test creating multiple projects for the same user."""
         # Arrange
-        user = setup_user
-        workspace = setup_workspace
+        user = module_user
+        workspace = module_workspace
         command = CreateProjectCommand(db)
 
         # Act - Create first project
@@ -206,13 +210,13 @@ class TestCreateProjectCommand:
         assert membership_2.role == PROJECT_MEMBER_ROLE
 
     def test_create_projects_different_users(
-        self, db, setup_user, setup_another_user, setup_workspace, faker
+        self, db, module_user, setup_another_user, module_workspace, faker
     ):
         """Test creating projects for different users."""
         # Arrange
-        user_1 = setup_user
+        user_1 = module_user
         user_2 = setup_another_user
-        workspace = setup_workspace
+        workspace = module_workspace
         command = CreateProjectCommand(db)
 
         # Act - Create project for user 1
@@ -258,12 +262,12 @@ class TestCreateProjectCommand:
         assert membership_2.role == PROJECT_MEMBER_ROLE
 
     def test_create_project_verifies_database_persistence(
-        self, db, setup_user, setup_workspace, faker
+        self, db, module_user, module_workspace, faker
     ):
         """Test that project and membership are properly persisted in database."""
         # Arrange
-        user = setup_user
-        workspace = setup_workspace
+        user = module_user
+        workspace = module_workspace
         project_data = ProjectCreate(
             name=faker.catch_phrase(),
             description=faker.text(100),
@@ -294,12 +298,12 @@ class TestCreateProjectCommand:
         assert db_membership.role == PROJECT_MEMBER_ROLE
 
     def test_create_project_with_minimal_data(
-        self, db, setup_user, setup_workspace, faker
+        self, db, module_user, module_workspace, faker
     ):
         """Test creating a project with only the required fields."""
         # Arrange
-        user = setup_user
-        workspace = setup_workspace
+        user = module_user
+        workspace = module_workspace
         project_data = ProjectCreate(
             name="Minimal Project",
             workspace_id=workspace.id,
@@ -329,12 +333,12 @@ class TestCreateProjectCommand:
         assert membership.role == PROJECT_MEMBER_ROLE
 
     def test_create_project_with_complex_labels(
-        self, db, setup_user, setup_workspace, faker
+        self, db, module_user, module_workspace, faker
     ):
         """Test creating a project with complex labels structure."""
         # Arrange
-        user = setup_user
-        workspace = setup_workspace
+        user = module_user
+        workspace = module_workspace
         complex_labels = {
             "type": "web_app",
             "priority": "high",
@@ -1,90 +1,184 @@
+from types import MappingProxyType
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event
+
 from app.commands.projects.import_items_command import ImportItemsCommand
 from app.models.import_request import ImportRequest
 from app.models.import_request_item import ImportRequestItem
 from app.models.source import Source
 from app.schemas.project_import import (
+    ImportAuthorData,
+    ImportItemData,
     ImportItemRequest,
 )
 from app.constants.import_constants import ImportRequestStatuses, ImportItemStatuses
 
+# Fields shared by most of the payloads below; tests only spell out what differs.
+_AUTHOR_TEMPLATE = MappingProxyType(
+    {
+        "avatar_url": "https://example.com/avatar",
+        "email": "test@example.com",
+        "tags": ["test"],
+        "labels": {"priority": "low"},
+        "meta_data": {"source": "github"},
+    }
+)
 
-class TestImportItemsCommand:
-    """Test cases for ImportItemsCommand."""
+_ITEM_TEMPLATE = MappingProxyType(
+    {
+        "source": "github",
+        "tags": ["test"],
+        "labels": {"priority": "low"},
+        "meta_data": {"repo": "test/repo"},
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+    }
+)
 
-    def test_import_items_success(self, db, setup_user, setup_project):
-        """Test successfully importing items."""
-        # Arrange
-        user = setup_user
-        project = setup_project
+_SINGLE_ITEM = {
+    **_ITEM_TEMPLATE,
+    "id": "1",
+    "title": "Single test item",
+    "body": "This is a test item",
+    "author": {
+        **_AUTHOR_TEMPLATE,
+        "id": "123456789",
+        "display_name": "Test Author",
+    },
+}
+
+_PERSISTENCE_ITEM = {
+    **_ITEM_TEMPLATE,
+    "id": "444444444",
+    "title": "Persistence test item",
+    "body": "Testing database persistence",
+    "tags": ["test", "persistence"],
+    "labels": {"priority": "medium"},
+    "meta_data": {"repo": "test/persistence"},
+    "author": {
+        **_AUTHOR_TEMPLATE,
+        "id": "444444444",
+        "display_name": "Persistence Tester",
+        "avatar_url": "https://example.com/persistence",
+        "email": "persistence@example.com",
+        "tags": ["test", "persistence"],
+        "labels": {"priority": "medium"},
+    },
+}
+
+_MINIMAL_ITEM = {
+    **_ITEM_TEMPLATE,
+    "id": "555555555",
+    "title": "Minimal item",
+    "body": "Minimal test item",
+    "tags": [],
+    "labels": {},
+    "meta_data": {},
+    "author": {
+        **_AUTHOR_TEMPLATE,
+        "id": "555555555",
+        "display_name": "Minimal Author",
+        "avatar_url": "https://example.com/minimal",
+        "email": "minimal@example.com",
+        "tags": [],
+        "labels": {},
+        "meta_data": {},
+    },
+}
+
+
+def _build_import_request(payload):
+    """Build an ImportItemRequest from trusted test data without re-validating it."""
+    return ImportItemRequest.model_construct(
+        source=payload["source"],
+        items=[
+            ImportItemData.model_construct(
+                **{**item, "author": ImportAuthorData.model_construct(**item["author"])}
+            )
+            for item in payload["items"]
+        ],
+    )
 
-        # Test payload from user request
-        payload = {
+
+@pytest.fixture(scope="module")
+def github_three_item_payload():
+    """Read-only three-item github payload; deep-copy it before mutating."""
+    return MappingProxyType(
+        {
             "source": "github",
             "items": [
                 {
+                    **_ITEM_TEMPLATE,
                     "id": "1",
-                    "source": "github",
                     "title": "API returns 500 error on POST /users",
                     "body": "Steps to reproduce:\n1. Send POST request to /users with valid payload\n2. Server responds with 500 instead of 201",
                     "tags": ["bug", "api"],
                     "labels": {"priority": "high"},
                     "meta_data": {"repo": "org/repo"},
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
                     "author": {
+                        **_AUTHOR_TEMPLATE,
                         "id": "9876543210",
                         "display_name": "Alice Smith",
                         "avatar_url": "https://avatar.url/alice",
                         "email": "alice.smith@example.com",
                         "tags": ["bug", "api"],
                         "labels": {"priority": "high"},
-                        "meta_data": {"source": "github"},
                     },
                 },
                 {
+                    **_ITEM_TEMPLATE,
                     "id": "2",
-                    "source": "github",
                     "title": "UI freezes when loading dashboard",
                     "body": "The dashboard page becomes unresponsive when more than 1000 records are loaded. Needs optimization.",
                     "tags": ["bug", "frontend"],
                     "labels": {"priority": "medium"},
                     "meta_data": {"repo": "org/repo"},
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
                     "author": {
+                        **_AUTHOR_TEMPLATE,
                         "id": "2468013579",
                         "display_name": "Bob Johnson",
                         "avatar_url": "https://avatar.url/bob",
                         "email": "bob.johnson@example.com",
                         "tags": ["bug", "frontend"],
                         "labels": {"priority": "medium"},
-                        "meta_data": {"source": "github"},
                     },
                 },
                 {
+                    **_ITEM_TEMPLATE,
                     "id": "3",
-                    "source": "github",
                     "title": "Add dark mode support",
                     "body": "Feature request: Implement dark mode toggle in settings. Many users have asked for this.",
                     "tags": ["enhancement", "ui"],
-                    "labels": {"priority": "low"},
                     "meta_data": {"repo": "org/repo"},
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
                     "author": {
+                        **_AUTHOR_TEMPLATE,
                         "id": "1122334455",
                         "display_name": "Charlie Lee",
                         "avatar_url": "https://avatar.url/charlie",
                         "email": "charlie.lee@example.com",
                         "tags": ["enhancement", "ui"],
-                        "labels": {"priority": "low"},
-                        "meta_data": {"source": "github"},
                     },
                 },
             ],
         }
+    )
 
-        import_request = ImportItemRequest(**payload)
+
+class TestImportItemsCommand:
+    """Test cases for ImportItemsCommand."""
+
+    def test_import_items_success(
+        self, db, setup_user, setup_project, github_three_item_payload
+    ):
+        """Test successfully importing items."""
+        # Arrange
+        user = setup_user
+        project = setup_project
+        payload = github_three_item_payload
+
+        import_request = _build_import_request(payload)
 
         # Act
         command = ImportItemsCommand(db)
@@ -108,9 +202,7 @@ class TestImportItemsCommand:
 
         # Assert import request was created
         id = result["id"]
-        db_import_request = (
-            db.query(ImportRequest).filter(ImportRequest.id == id).first()
-        )
+        db_import_request = db.get(ImportRequest, UUID(id))
         assert db_import_request is not None
         assert db_import_request.project_id == project.id
         assert db_import_request.requested_by_id == user.id
@@ -120,40 +212,40 @@ class TestImportItemsCommand:
         assert db_import_request.failure_count == 0
 
         # Assert source was created
-        source = (
-            db.query(Source).filter(Source.id == db_import_request.source_id).first()
-        )
+        source = db.get(Source, db_import_request.source_id)
         assert source is not None
         assert source.identifier == "github"
         assert source.workspace_id == project.workspace_id
 
-        # Assert import request items were created
+        # Assert import request items were created. Rows come back in no
+        # particular order, so match them to the payload by source_item_id.
         items = (
             db.query(ImportRequestItem)
             .filter(ImportRequestItem.import_request_id == id)
             .all()
         )
         assert len(items) == 3
+        items_by_source_item_id = {item.source_item_id: item for item in items}
 
         # Assert each item has correct data
-        for i, item in enumerate(items):
+        for payload_item in payload["items"]:
+            # Check that source_item_id matches author ID
+            expected_author_id = payload_item["author"]["id"]
+            item = items_by_source_item_id[expected_author_id]
+
             assert item.status == ImportItemStatuses.PENDING
             assert item.source_id == source.id
             assert item.raw_payload is not None
 
-            # Check that source_item_id matches author ID
-            expected_author_id = payload["items"][i]["author"]["id"]
-            assert item.source_item_id == expected_author_id
-
             # Check raw payload contains the full item data
             raw_data = item.raw_payload
-            assert raw_data["source"] == payload["items"][i]["source"]
-            assert raw_data["title"] == payload["items"][i]["title"]
-            assert raw_data["body"] == payload["items"][i]["body"]
+            assert raw_data["source"] == payload_item["source"]
+            assert raw_data["title"] == payload_item["title"]
+            assert raw_data["body"] == payload_item["body"]
             assert raw_data["author"]["id"] == expected_author_id
             assert (
                 raw_data["author"]["display_name"]
-                == payload["items"][i]["author"]["display_name"]
+                == payload_item["author"]["display_name"]
             )
 
     def test_import_items_empty_list(self, db, setup_user, setup_project):
@@ -176,71 +268,10 @@ class TestImportItemsCommand:
 
         # Assert import request was created
         id = result["id"]
-        db_import_request = (
-            db.query(ImportRequest).filter(ImportRequest.id == id).first()
-        )
+        db_import_request = db.get(ImportRequest, UUID(id))
         assert db_import_request is not None
         assert db_import_request.status == ImportRequestStatuses.PENDING
 
-    def test_import_items_single_item(self, db, setup_user, setup_project):
-        """Test importing a single item."""
-        # Arrange
-        user = setup_user
-        project = setup_project
-
-        payload = {
-            "source": "github",
-            "items": [
-                {
-                    "id": "1",
-                    "source": "github",
-                    "title": "Single test item",
-                    "body": "This is a test item",
-                    "tags": ["test"],
-                    "labels": {"priority": "low"},
-                    "meta_data": {"repo": "test/repo"},
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
-                    "author": {
-                        "id": "123456789",
-                        "display_name": "Test Author",
-                        "avatar_url": "https://example.com/avatar",
-                        "email": "test@example.com",
-                        "tags": ["test"],
-                        "labels": {"priority": "low"},
-                        "meta_data": {"source": "github"},
-                    },
-                }
-            ],
-        }
-
-        import_request = ImportItemRequest(**payload)
-
-        # Act
-        command = ImportItemsCommand(db)
-        result = command.execute(project, import_request, user.id)
-
-        # Assert result
-        assert result["total_items"] == 1
-        assert result["processed_items"] == 0
-        assert result["success_count"] == 0
-        assert result["failure_count"] == 0
-        assert result["status"] == ImportRequestStatuses.PENDING
-
-        # Assert single item was created
-        id = result["id"]
-        items = (
-            db.query(ImportRequestItem)
-            .filter(ImportRequestItem.import_request_id == id)
-            .all()
-        )
-        assert len(items) == 1
-
-        item = items[0]
-        assert item.source_item_id == "123456789"
-        assert item.status == ImportItemStatuses.PENDING
-        assert item.raw_payload["title"] == "Single test item"
-
     def test_import_items_creates_source_once(self, db, setup_user, setup_project):
         """Test that source is created only once per project."""
         # Arrange
@@ -252,23 +283,16 @@ class TestImportItemsCommand:
             "source": "github",
             "items": [
                 {
+                    **_ITEM_TEMPLATE,
                     "id": "888888888",
-                    "source": "github",
                     "title": "First item",
                     "body": "First test item",
-                    "tags": ["test"],
-                    "labels": {"priority": "low"},
-                    "meta_data": {"repo": "test/repo"},
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
                     "author": {
+                        **_AUTHOR_TEMPLATE,
                         "id": "111111111",
                         "display_name": "Author 1",
                         "avatar_url": "https://example.com/avatar1",
                         "email": "author1@example.com",
-                        "tags": ["test"],
-                        "labels": {"priority": "low"},
-                        "meta_data": {"source": "github"},
                     },
                 }
             ],
@@ -278,23 +302,16 @@ class TestImportItemsCommand:
             "source": "github",
             "items": [
                 {
+                    **_ITEM_TEMPLATE,
                     "id": "777777777",
-                    "source": "github",
                     "title": "Second item",
                     "body": "Second test item",
-                    "tags": ["test"],
-                    "labels": {"priority": "low"},
-                    "meta_data": {"repo": "test/repo"},
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
                     "author": {
+                        **_AUTHOR_TEMPLATE,
                         "id": "222222222",
                         "display_name": "Author 2",
                         "avatar_url": "https://example.com/avatar2",
                         "email": "author2@example.com",
-                        "tags": ["test"],
-                        "labels": {"priority": "low"},
-                        "meta_data": {"source": "github"},
                     },
                 }
             ],
@@ -302,8 +319,8 @@ class TestImportItemsCommand:
 
         # Act
         command = ImportItemsCommand(db)
-        result1 = command.execute(project, ImportItemRequest(**payload1), user.id)
-        result2 = command.execute(project, ImportItemRequest(**payload2), user.id)
+        result1 = command.execute(project, _build_import_request(payload1), user.id)
+        result2 = command.execute(project, _build_import_request(payload2), user.id)
 
         # Assert both import requests were created
         assert result1["success_count"] == 0
@@ -319,16 +336,39 @@ class TestImportItemsCommand:
         assert source.identifier == "github"
 
         # Assert both import requests use the same source
-        import_request1 = (
-            db.query(ImportRequest).filter(ImportRequest.id == result1["id"]).first()
-        )
-        import_request2 = (
-            db.query(ImportRequest).filter(ImportRequest.id == result2["id"]).first()
-        )
+        import_request1 = db.get(ImportRequest, UUID(result1["id"]))
+        import_request2 = db.get(ImportRequest, UUID(result2["id"]))
 
         assert import_request1.source_id == source.id
         assert import_request2.source_id == source.id
 
+    def test_import_items_looks_up_source_once(self, db, setup_user, setup_project):
+        """Test that repeated executes reuse the source id instead of querying it."""
+        user = setup_user
+        project = setup_project
+        payload = {"source": "github", "items": [_SINGLE_ITEM]}
+        command = ImportItemsCommand(db)
+        result1 = command.execute(project, _build_import_request(payload), user.id)
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        connection = db.connection()
+        event.listen(connection, "before_cursor_execute", record)
+        try:
+            result2 = command.execute(project, _build_import_request(payload), user.id)
+        finally:
+            event.remove(connection, "before_cursor_execute", record)
+
+        assert not [
+            statement for statement in statements if "FROM sources" in statement
+        ]
+        import_request1 = db.get(ImportRequest, UUID(result1["id"]))
+        import_request2 = db.get(ImportRequest, UUID(result2["id"]))
+        assert import_request2.source_id == import_request1.source_id
+
     def test_import_items_different_projects(
         self, db, setup_user, setup_project, faker
     ):
@@ -346,30 +386,20 @@ class TestImportItemsCommand:
             workspace_id=project1.workspace_id,
         )
         db.add(project2)
-        db.commit()
-        db.refresh(project2)
+        db.flush()
 
         payload = {
             "source": "github",
             "items": [
                 {
+                    **_ITEM_TEMPLATE,
                     "id": "666666666",
-                    "source": "github",
                     "title": "Test item",
                     "body": "Test item body",
-                    "tags": ["test"],
-                    "labels": {"priority": "low"},
-                    "meta_data": {"repo": "test/repo"},
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
                     "author": {
+                        **_AUTHOR_TEMPLATE,
                         "id": "333333333",
                         "display_name": "Test Author",
-                        "avatar_url": "https://example.com/avatar",
-                        "email": "test@example.com",
-                        "tags": ["test"],
-                        "labels": {"priority": "low"},
-                        "meta_data": {"source": "github"},
                     },
                 }
             ],
@@ -377,8 +407,8 @@ class TestImportItemsCommand:
 
         # Act
         command = ImportItemsCommand(db)
-        result1 = command.execute(project1, ImportItemRequest(**payload), user.id)
-        result2 = command.execute(project2, ImportItemRequest(**payload), user.id)
+        result1 = command.execute(project1, _build_import_request(payload), user.id)
+        result2 = command.execute(project2, _build_import_request(payload), user.id)
 
         # Assert both import requests were created
         assert result1["success_count"] == 0
@@ -393,115 +423,51 @@ class TestImportItemsCommand:
         source_identifiers = [source.identifier for source in sources]
         assert "github" in source_identifiers
 
-    def test_import_items_verifies_database_persistence(
-        self, db, setup_user, setup_project
-    ):
-        """Test that import request and items are properly persisted in database."""
+    @pytest.mark.parametrize(
+        "item",
+        [_SINGLE_ITEM, _PERSISTENCE_ITEM, _MINIMAL_ITEM],
+        ids=["single_item", "database_persistence", "minimal_data"],
+    )
+    def test_import_items_single_item(self, db, setup_user, setup_project, item):
+        """Test importing a single item and that it is persisted with its raw payload."""
         # Arrange
         user = setup_user
         project = setup_project
-
-        payload = {
-            "source": "github",
-            "items": [
-                {
-                    "id": "444444444",
-                    "source": "github",
-                    "title": "Persistence test item",
-                    "body": "Testing database persistence",
-                    "tags": ["test", "persistence"],
-                    "labels": {"priority": "medium"},
-                    "meta_data": {"repo": "test/persistence"},
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
-                    "author": {
-                        "id": "444444444",
-                        "display_name": "Persistence Tester",
-                        "avatar_url": "https://example.com/persistence",
-                        "email": "persistence@example.com",
-                        "tags": ["test", "persistence"],
-                        "labels": {"priority": "medium"},
-                        "meta_data": {"source": "github"},
-                    },
-                }
-            ],
-        }
+        payload = {"source": "github", "items": [item]}
 
         # Act
         command = ImportItemsCommand(db)
-        result = command.execute(project, ImportItemRequest(**payload), user.id)
+        result = command.execute(project, _build_import_request(payload), user.id)
+
+        # Assert result
+        assert result["total_items"] == 1
+        assert result["processed_items"] == 0
+        assert result["success_count"] == 0
+        assert result["failure_count"] == 0
+        assert result["status"] == ImportRequestStatuses.PENDING
 
         # Assert import request exists in database
         id = result["id"]
-        db_import_request = (
-            db.query(ImportRequest).filter(ImportRequest.id == id).first()
-        )
+        db_import_request = db.get(ImportRequest, UUID(id))
         assert db_import_request is not None
         assert db_import_request.project_id == project.id
         assert db_import_request.requested_by_id == user.id
 
-        # Assert import request item exists in database
-        db_item = (
+        # Assert single item was created
+        items = (
             db.query(ImportRequestItem)
             .filter(ImportRequestItem.import_request_id == id)
-            .first()
+            .all()
         )
-        assert db_item is not None
-        assert db_item.source_item_id == "444444444"
-        assert db_item.status == ImportItemStatuses.PENDING
-        assert db_item.raw_payload["title"] == "Persistence test item"
-        assert db_item.raw_payload["author"]["display_name"] == "Persistence Tester"
-
-    def test_import_items_with_minimal_data(self, db, setup_user, setup_project):
-        """Test importing items with minimal required data."""
-        # Arrange
-        user = setup_user
-        project = setup_project
-
-        payload = {
-            "source": "github",
-            "items": [
-                {
-                    "id": "555555555",
-                    "source": "github",
-                    "title": "Minimal item",
-                    "body": "Minimal test item",
-                    "tags": [],
-                    "labels": {},
-                    "meta_data": {},
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
-                    "author": {
-                        "id": "555555555",
-                        "display_name": "Minimal Author",
-                        "avatar_url": "https://example.com/minimal",
-                        "email": "minimal@example.com",
-                        "tags": [],
-                        "labels": {},
-                        "meta_data": {},
-                    },
-                }
-            ],
-        }
-
-        # Act
-        command = ImportItemsCommand(db)
-        result = command.execute(project, ImportItemRequest(**payload), user.id)
+        assert len(items) == 1
 
-        # Assert result
-        assert result["success_count"] == 0
-        assert result["failure_count"] == 0
-        assert result["status"] == ImportRequestStatuses.PENDING
+        db_item = items[0]
+        assert db_item.source_item_id == item["author"]["id"]
+        assert db_item.status == ImportItemStatuses.PENDING
 
-        # Assert item was created with minimal data
-        id = result["id"]
-        db_item = (
-            db.query(ImportRequestItem)
-            .filter(ImportRequestItem.import_request_id == id)
-            .first()
-        )
-        assert db_item is not None
-        assert db_item.source_item_id == "555555555"
-        assert db_item.raw_payload["title"] == "Minimal item"
-        assert db_item.raw_payload["tags"] == []
-        assert db_item.raw_payload["labels"] == {}
+        # raw_payload is a JSONB column, decoded once by the driver on load
+        raw_data = db_item.raw_payload
+        assert raw_data["title"] == item["title"]
+        assert raw_data["tags"] == item["tags"]
+        assert raw_data["labels"] == item["labels"]
+        assert raw_data["author"]["display_name"] == item["author"]["display_name"]
@@ -1,12 +1,19 @@
 import pytest
+from uuid import uuid4
 
 from app.commands.projects.process_import_item_command import ProcessImportItemCommand
+from app.models.entry import Entry
+from app.models.import_request_item import ImportRequestItem
+from app.models.source import Source
+from app.models.source_author import SourceAuthor
+from app.schemas.author import AuthorCreate
 from app.schemas.project_import import (
     ImportItemData,
     ImportAuthorData,
     ImportEntryUpdateData,
 )
 from app.constants.import_constants import ImportItemStatuses
+from tests.fixtures.import_request_fixtures import seed_rows
 
 
 @pytest.fixture
@@ -15,12 +22,61 @@ def process_command(db):
     return ProcessImportItemCommand(db)
 
 
-@pytest.fixture
+# The sample payloads below are built with model_construct, skipping field
+# validation; execute() still validates the dumped raw_payload itself.
+
+
+# (author/comment id, author name, author email, comment body)
+_SAMPLE_COMMENTS = [
+    (
+        "1234567890",
+        "John Doe",
+        "john.doe@example.com",
+        "I am also experiencing this issue.",
+    ),
+    ("1122334455", "Jane Roe", "jane.roe@example.com", "I can reproduce this issue."),
+]
+
+
+def _import_author(**fields):
+    """Build ImportAuthorData; tags, labels and meta_data default to empty."""
+    return ImportAuthorData.model_construct(
+        **{"tags": [], "labels": {}, "meta_data": {}, **fields}
+    )
+
+
+def _import_entry_update(id, body, author):
+    """Build an ImportEntryUpdateData shaped like a GitHub issue comment."""
+    return ImportEntryUpdateData.model_construct(
+        id=id,
+        body=body,
+        created_at="2024-10-01T12:34:56Z",
+        updated_at="2024-10-01T12:34:56Z",
+        author=author,
+        tags=["bug", "api"],
+        labels={"priority": "high"},
+    )
+
+
+def _import_item(**fields):
+    """Build an ImportItemData for a GitHub issue with no entry updates by default."""
+    return ImportItemData.model_construct(
+        **{
+            "id": "1",
+            "source": "github",
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-01T00:00:00Z",
+            "assignee": None,
+            "entry_updates": [],
+            **fields,
+        }
+    )
+
+
+@pytest.fixture(scope="module")
 def sample_import_item_data():
-    """Create sample import item data for testing."""
-    return ImportItemData(
-        id="1",
-        source="github",
+    """Create sample import item data for testing; tests treat it as read-only."""
+    return _import_item(
         title="Test Issue",
         body="This is a test issue body",
         tags=["bug", "test"],
@@ -29,9 +85,7 @@ def sample_import_item_data():
             "external_id": "123",
             "url": "https://github.com/test/repo/issues/123",
         },
-        created_at="2025-01-01T00:00:00Z",
-        updated_at="2025-01-01T00:00:00Z",
-        author=ImportAuthorData(
+        author=_import_author(
             id="author_123",
             display_name="Test Author",
             avatar_url="https://github.com/avatar.png",
@@ -40,24 +94,25 @@ def sample_import_item_data():
             labels={"role": "maintainer"},
             meta_data={"github_username": "testauthor"},
         ),
-        entry_updates=[],  # Empty entry updates by default
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def sample_import_item_payload(sample_import_item_data):
+    """Serialized sample_import_item_data, dumped once per module."""
+    return sample_import_item_data.model_dump()
+
+
+@pytest.fixture(scope="module")
 def sample_import_item_data_with_comments():
-    """Create sample import item data with entry updates for testing."""
-    return ImportItemData(
-        id="1",
-        source="github",
+    """Create sample import item data with entry updates; tests treat it as read-only."""
+    return _import_item(
         title="API returns 500 error on POST /users",
         body="Steps to reproduce:\n1. Send POST request to /users with valid payload\n2. Server responds with 500 instead of 201",
         tags=["bug", "api"],
         labels={"priority": "high"},
         meta_data={"repo": "org/repo"},
-        created_at="2025-01-01T00:00:00Z",
-        updated_at="2025-01-01T00:00:00Z",
-        author=ImportAuthorData(
+        author=_import_author(
             id="9876543210",
             display_name="Alice Smith",
             avatar_url="https://avatar.url/alice",
@@ -67,621 +122,347 @@ def sample_import_item_data_with_comments():
             meta_data={"source": "github"},
         ),
         entry_updates=[
-            ImportEntryUpdateData(
-                id="1234567890",
-                body="I am also experiencing this issue.",
-                created_at="2024-10-01T12:34:56Z",
-                updated_at="2024-10-01T12:34:56Z",
-                author=ImportAuthorData(
-                    id="1234567890",
-                    display_name="John Doe",
-                    avatar_url="https://avatar.url/john",
-                    email="john.doe@example.com",
-                    tags=[],
-                    labels={},
-                    meta_data={},
+            _import_entry_update(
+                author_id,
+                body,
+                _import_author(
+                    id=author_id,
+                    display_name=name,
+                    avatar_url=f"https://avatar.url/{name.split()[0].lower()}",
+                    email=email,
                 ),
-                tags=["bug", "api"],
-                labels={"priority": "high"},
-            ),
-            ImportEntryUpdateData(
-                id="1122334455",
-                body="I can reproduce this issue.",
-                created_at="2024-10-01T12:34:56Z",
-                updated_at="2024-10-01T12:34:56Z",
-                author=ImportAuthorData(
-                    id="1122334455",
-                    display_name="Jane Roe",
-                    avatar_url="https://avatar.url/jane",
-                    email="jane.roe@example.com",
-                    tags=[],
-                    labels={},
-                    meta_data={},
-                ),
-                tags=["bug", "api"],
-                labels={"priority": "high"},
-            ),
+            )
+            for author_id, name, email, body in _SAMPLE_COMMENTS
         ],
     )
 
 
-class TestProcessImportItemCommand:
-    """Test cases for ProcessImportItemCommand."""
+@pytest.fixture(scope="module")
+def sample_import_item_payload_with_comments(sample_import_item_data_with_comments):
+    """Serialized sample_import_item_data_with_comments, dumped once per module."""
+    return sample_import_item_data_with_comments.model_dump()
 
-    def test_execute_success(
-        self, process_command, setup_project, sample_import_item_data, test_user
-    ):
-        """Test successful processing of an import item."""
-        # Create a proper import request item with the correct payload
-        from app.models.import_request_item import ImportRequestItem
-        from app.models.import_request import ImportRequest
-        from app.models.source import Source
 
-        # Create source first
-        source = Source(
-            name="Test Source",
-            identifier="github",
-            workspace_id=setup_project.workspace_id,
-        )
-        process_command.db.add(source)
-        process_command.db.commit()
-        process_command.db.refresh(source)
-
-        # Create import request
-        import_request = ImportRequest(
-            source_id=source.id,
-            requested_by_id=test_user.id,
-            status="pending",
-            received_count=1,
-            success_count=0,
-            failure_count=0,
-            project_id=setup_project.id,
-        )
-        process_command.db.add(import_request)
-        process_command.db.commit()
-        process_command.db.refresh(import_request)
-
-        # Create import request item with proper payload
-        import_request_item = ImportRequestItem(
-            import_request_id=import_request.id,
-            source_id=source.id,
-            source_item_id="item_123",
-            raw_payload=sample_import_item_data.model_dump(),
-            status=ImportItemStatuses.FAILED,
-        )
-        process_command.db.add(import_request_item)
-        process_command.db.commit()
-        process_command.db.refresh(import_request_item)
-
-        # Execute the command
-        result = process_command.execute(import_request_item, setup_project)
-
-        # Assertions
-        assert result["success"] is True
-        assert "author_id" in result
-        assert "entry_id" in result
-        assert "entry_update_ids" in result
-        assert "source_author_id" in result
-
-    def test_execute_with_existing_author(
-        self, process_command, setup_project, sample_import_item_data, test_user
-    ):
-        """Test processing when author already exists."""
-        # Create a proper import request item with the correct payload
-        from app.models.import_request_item import ImportRequestItem
-        from app.models.import_request import ImportRequest
-        from app.models.source import Source
-        from app.services.author_service import AuthorService
-        from app.schemas.author import AuthorCreate
-
-        # Create source first
-        source = Source(
-            name="Test Source",
-            identifier="github",
-            workspace_id=setup_project.workspace_id,
-        )
-        process_command.db.add(source)
-        process_command.db.commit()
-        process_command.db.refresh(source)
-
-        # Create import request
-        import_request = ImportRequest(
-            source_id=source.id,
-            requested_by_id=test_user.id,
-            status="pending",
-            received_count=1,
-            success_count=0,
-            failure_count=0,
-            project_id=setup_project.id,
-        )
-        process_command.db.add(import_request)
-        process_command.db.commit()
-        process_command.db.refresh(import_request)
-
-        # Create import request item with proper payload
-        import_request_item = ImportRequestItem(
-            import_request_id=import_request.id,
-            source_id=source.id,
-            source_item_id="item_123",
-            raw_payload=sample_import_item_data.model_dump(),
-            status=ImportItemStatuses.FAILED,
-        )
-        process_command.db.add(import_request_item)
-        process_command.db.commit()
-        process_command.db.refresh(import_request_item)
-
-        # First, create an author with the same external ID through source_authors
-        author_service = AuthorService(process_command.db)
-        existing_author = author_service.create_author(
-            AuthorCreate(
-                display_name="Existing Author",
-                email=sample_import_item_data.author.email,
-                avatar_url="https://example.com/avatar.png",
-            ),
-            setup_project.workspace_id,
-        )
+def _import_request_item(source, import_request, raw_payload):
+    """Build an unsaved import request item; the id is generated client side."""
+    return ImportRequestItem(
+        import_request_id=import_request.id,
+        source_id=source.id,
+        source_item_id="item_123",
+        raw_payload=raw_payload,
+        status=ImportItemStatuses.PENDING,
+    )
 
-        # Create the source_author relationship with the same external ID
-        from app.services.source_author_service import SourceAuthorService
 
-        source_author_service = SourceAuthorService(process_command.db)
-        source_author_service.get_or_create_source_author(
-            source.id, existing_author.id, sample_import_item_data.author.id
-        )
+def _test_source(project):
+    """Build an unsaved GitHub source in the project's workspace."""
+    return Source(
+        name="Test Source",
+        identifier="github",
+        workspace_id=project.workspace_id,
+    )
 
-        # Execute the command
-        result = process_command.execute(import_request_item, setup_project)
 
-        # Assertions
-        assert result["success"] is True
-        assert result["author_id"] == existing_author.id
-        assert "entry_id" in result
-        assert "entry_update_ids" in result
-        assert "source_author_id" in result
-
-    def test_execute_with_validation_error(
-        self, process_command, setup_import_request_item, setup_project
-    ):
-        """Test processing with invalid data that causes validation error."""
-        # Set invalid raw payload
-        setup_import_request_item.raw_payload = {"invalid": "data"}
-
-        # Execute the command
-        result = process_command.execute(setup_import_request_item, setup_project)
-
-        # Assertions
-        assert result["success"] is False
-        assert "error" in result
-
-    def test_execute_with_service_error(
-        self,
-        process_command,
-        setup_import_request_item,
-        setup_project,
-        sample_import_item_data,
-    ):
-        """Test processing when a service throws an exception."""
-        # This test would require a more complex setup to trigger a real service error
-        # For now, we'll test with invalid data that causes a validation error
-        setup_import_request_item.raw_payload = {"invalid": "data"}
-
-        # Execute the command
-        result = process_command.execute(setup_import_request_item, setup_project)
-
-        # Assertions
-        assert result["success"] is False
-        assert "error" in result
-
-    def test_create_or_get_author_new_author(
-        self, process_command, sample_import_item_data, setup_project
-    ):
-        """Test creating a new author."""
-        result = process_command._create_or_get_author(
-            sample_import_item_data.author, setup_project.workspace_id
-        )
+def _seed_entry_deps(db, project, author):
+    """Seed a source and a source author for ``author`` in a single flush."""
+    source = _test_source(project)
+    source_author = SourceAuthor(
+        author_id=author.id, source=source, source_author_id="external_author_123"
+    )
+    seed_rows(db, source, source_author)
+    return source, source_author
 
-        assert result is not None
-        assert result.email == sample_import_item_data.author.email
-        assert result.display_name == sample_import_item_data.author.display_name
-
-    def test_create_or_get_author_existing_author(
-        self, process_command, sample_import_item_data, setup_project
-    ):
-        """Test getting an existing author by external ID through source_authors."""
-        # First create an author and source
-        from app.services.author_service import AuthorService
-        from app.schemas.author import AuthorCreate
-        from app.models.source import Source
-        from app.services.source_author_service import SourceAuthorService
-
-        # Create source
-        source = Source(
-            name="Test Source",
-            identifier="github",
-            workspace_id=setup_project.workspace_id,
-        )
-        process_command.db.add(source)
-        process_command.db.commit()
-        process_command.db.refresh(source)
-
-        author_service = AuthorService(process_command.db)
-        existing_author = author_service.create_author(
-            AuthorCreate(
-                display_name="Existing Author",
-                email=sample_import_item_data.author.email,
-                avatar_url="https://example.com/avatar.png",
-            ),
-            setup_project.workspace_id,
-        )
 
-        # Create the source_author relationship with the same external ID
-        source_author_service = SourceAuthorService(process_command.db)
-        source_author_service.get_or_create_source_author(
-            source.id, existing_author.id, sample_import_item_data.author.id
-        )
+@pytest.fixture
+def preseeded_author(process_command, sample_import_item_data, module_project):
+    """Create an author with the sample author's email in the module workspace."""
+    return process_command.author_service.create_author(
+        AuthorCreate(
+            display_name="Existing Author",
+            email=sample_import_item_data.author.email,
+            avatar_url="https://example.com/avatar.png",
+        ),
+        module_project.workspace_id,
+    )
 
-        # Now test getting the existing author by external ID
-        result = process_command._create_or_get_author(
-            sample_import_item_data.author, setup_project.workspace_id, source.id
-        )
 
-        assert result.id == existing_author.id
-        assert result.email == existing_author.email
-
-    def test_create_or_get_source_author(
-        self, process_command, sample_import_item_data, setup_project
-    ):
-        """Test creating or getting a source author."""
-        # First create an author and source
-        from app.services.author_service import AuthorService
-        from app.services.source_service import SourceService
-        from app.schemas.author import AuthorCreate
-        from app.schemas.source import SourceCreate
-
-        author_service = AuthorService(process_command.db)
-        author = author_service.create_author(
-            AuthorCreate(
-                display_name="Test Author",
-                email=sample_import_item_data.author.email,
-                avatar_url="https://example.com/avatar.png",
-            ),
-            setup_project.workspace_id,
-        )
+@pytest.fixture
+def seeded_entry(
+    process_command, sample_import_item_data, module_project, preseeded_author
+):
+    """Seed an entry, with its source and source author; returns ``(source, entry)``."""
+    source, source_author = _seed_entry_deps(
+        process_command.db, module_project, preseeded_author
+    )
+    entry = Entry(
+        title=sample_import_item_data.title,
+        body=sample_import_item_data.body,
+        source_id=source.id,
+        external_id="external_entry_123",
+        source_author_id=source_author.id,
+        project_id=module_project.id,
+    )
+    seed_rows(process_command.db, entry)
+    return source, entry
+
 
-        source_service = SourceService(process_command.db)
-        source = source_service.create_source(
-            SourceCreate(name="Test Source", identifier="github"),
-            setup_project.workspace_id,
+@pytest.fixture
+def seeded_item(request, process_command, module_source, module_import_request):
+    """Seed an import request item as described by the indirect ``request.param``.
+
+    ``payload`` is either a raw payload dict or the name of a fixture providing
+    one. With ``preseed_author`` the sample author is created beforehand and
+    linked to the source, and is returned alongside the item.
+    """
+    params = request.param
+    payload = params["payload"]
+    if isinstance(payload, str):
+        payload = request.getfixturevalue(payload)
+
+    # Source and import request are shared module fixtures
+    rows = [_import_request_item(module_source, module_import_request, payload)]
+
+    existing_author = None
+    if params.get("preseed_author"):
+        existing_author = request.getfixturevalue("preseeded_author")
+        rows.append(
+            SourceAuthor(
+                author_id=existing_author.id,
+                source_id=module_source.id,
+                source_author_id=request.getfixturevalue(
+                    "sample_import_item_data"
+                ).author.id,
+            )
         )
 
-        source_author_id = "external_author_123"
+    seed_rows(process_command.db, *rows)
+    return rows[0], existing_author
 
-        result = process_command._create_or_get_source_author(
-            author.id, source.id, source_author_id
-        )
 
-        assert result is not None
-        assert result.author_id == author.id
-        assert result.source_id == source.id
-        assert result.source_author_id == source_author_id
-
-    def test_create_entry(
-        self, process_command, sample_import_item_data, setup_project
-    ):
-        """Test creating an entry."""
-        # First create required dependencies
-        from app.services.author_service import AuthorService
-        from app.services.source_service import SourceService
-        from app.services.source_author_service import SourceAuthorService
-        from app.schemas.author import AuthorCreate
-        from app.schemas.source import SourceCreate
-
-        author_service = AuthorService(process_command.db)
-        author = author_service.create_author(
-            AuthorCreate(
-                display_name="Test Author",
-                email=sample_import_item_data.author.email,
-                avatar_url="https://example.com/avatar.png",
-            ),
-            setup_project.workspace_id,
-        )
+# All tests share a module-scoped project, and the execute tests also a
+# source and import request; the items, authors and entries each test
+# creates are rolled back with it.
 
-        source_service = SourceService(process_command.db)
-        source = source_service.create_source(
-            SourceCreate(name="Test Source", identifier="github"),
-            setup_project.workspace_id,
-        )
 
-        source_author_service = SourceAuthorService(process_command.db)
-        source_author = source_author_service.get_or_create_source_author(
-            source.id, author.id, "external_author_123"
-        )
+@pytest.mark.parametrize(
+    "seeded_item, expected_entry_update_count",
+    [
+        ({"payload": "sample_import_item_payload"}, 0),
+        (
+            {"payload": "sample_import_item_payload", "preseed_author": True},
+            0,
+        ),
+        ({"payload": "sample_import_item_payload_with_comments"}, 2),
+    ],
+    ids=["new_author", "existing_author", "with_comments"],
+    indirect=["seeded_item"],
+)
+def test_execute(
+    process_command, module_project, seeded_item, expected_entry_update_count
+):
+    """Test successful processing of an import item."""
+    import_request_item, existing_author = seeded_item
+
+    result = process_command.execute(import_request_item, module_project)
+
+    assert result["success"] is True
+    assert "author_id" in result
+    assert "entry_id" in result
+    assert "source_author_id" in result
+    assert len(result["entry_update_ids"]) == expected_entry_update_count
+    if existing_author is not None:
+        assert result["author_id"] == existing_author.id
 
-        result = process_command._create_entry(
-            sample_import_item_data,
-            source_author.id,
-            None,  # source_assignee_id
-            source.id,
-            setup_project.id,
-            "external_entry_123",
-        )
 
-        assert result is not None
-        assert result.title == sample_import_item_data.title
-        assert result.body == sample_import_item_data.body
-        assert result.source_id == source.id
-        assert result.source_author_id == source_author.id
-        assert result.project_id == setup_project.id
-
-    def test_create_entry_updates_with_comments_field(
-        self, process_command, sample_import_item_data_with_comments, setup_project
-    ):
-        """Test creating entry updates when entry_updates field is present."""
-        # First create required dependencies
-        from app.services.author_service import AuthorService
-        from app.services.source_service import SourceService
-        from app.services.source_author_service import SourceAuthorService
-        from app.services.entry_service import EntryService
-        from app.schemas.author import AuthorCreate
-        from app.schemas.source import SourceCreate
-        from app.schemas.entry import EntryCreate
-
-        # Create the main author
-        author_service = AuthorService(process_command.db)
-        author = author_service.create_author(
-            AuthorCreate(
-                display_name="Test Author",
-                email=sample_import_item_data_with_comments.author.email,
-                avatar_url="https://example.com/avatar.png",
-            ),
-            setup_project.workspace_id,
-        )
+@pytest.mark.parametrize(
+    "seeded_item",
+    [
+        {"payload": {"invalid": "data"}},
+        {"payload": {}},
+        {"payload": {"source": "github"}},
+    ],
+    ids=["unknown_fields", "empty", "missing_fields"],
+    indirect=True,
+)
+def test_execute_with_validation_error(process_command, module_project, seeded_item):
+    """Test that a validation error marks the stored item as failed with the error."""
+    import_request_item, _ = seeded_item
+    raw_payload = dict(import_request_item.raw_payload)
 
-        source_service = SourceService(process_command.db)
-        source = source_service.create_source(
-            SourceCreate(name="Test Source", identifier="github"),
-            setup_project.workspace_id,
-        )
+    result = process_command.execute(import_request_item, module_project)
 
-        source_author_service = SourceAuthorService(process_command.db)
-        source_author = source_author_service.get_or_create_source_author(
-            source.id, author.id, "external_author_123"
-        )
+    assert result["success"] is False
+    assert "error" in result
 
-        entry_service = EntryService(process_command.db)
-        entry = entry_service.create_entry(
-            EntryCreate(
-                title=sample_import_item_data_with_comments.title,
-                body=sample_import_item_data_with_comments.body,
-                source_id=source.id,
-                external_id="external_entry_123",
-                source_author_id=source_author.id,
-                project_id=setup_project.id,
-                source_created_at=sample_import_item_data_with_comments.created_at,
-                source_updated_at=sample_import_item_data_with_comments.updated_at,
-            )
-        )
+    db = process_command.db
+    db.expire_all()
+    stored_item = db.get(ImportRequestItem, import_request_item.id)
+    assert stored_item.status == ImportItemStatuses.FAILED
+    assert stored_item.raw_payload == {**raw_payload, "error": result["error"]}
 
-        result = process_command._create_entry_updates(
-            sample_import_item_data_with_comments,
-            entry.id,
-            setup_project.workspace_id,
-            source.id,
-        )
 
-        # Should create 2 entry updates from the entry_updates field
-        assert len(result) == 2
-
-        # Check first entry update
-        assert result[0].body == "I am also experiencing this issue."
-        assert result[0].entry_id == entry.id
-        assert result[0].tags == ["bug", "api"]
-        assert result[0].labels == {"priority": "high"}
-
-        # Check second entry update
-        assert result[1].body == "I can reproduce this issue."
-        assert result[1].entry_id == entry.id
-        assert result[1].tags == ["bug", "api"]
-        assert result[1].labels == {"priority": "high"}
-
-    def test_create_entry_updates_without_comments_field(
-        self, process_command, sample_import_item_data, setup_project
-    ):
-        """Test creating entry updates when entry_updates field is empty."""
-        # First create required dependencies
-        from app.services.author_service import AuthorService
-        from app.services.source_service import SourceService
-        from app.services.source_author_service import SourceAuthorService
-        from app.services.entry_service import EntryService
-        from app.schemas.author import AuthorCreate
-        from app.schemas.source import SourceCreate
-        from app.schemas.entry import EntryCreate
-
-        author_service = AuthorService(process_command.db)
-        author = author_service.create_author(
-            AuthorCreate(
-                display_name="Test Author",
-                email=sample_import_item_data.author.email,
-                avatar_url="https://example.com/avatar.png",
-            ),
-            setup_project.workspace_id,
-        )
+def test_create_or_get_author_new_author(
+    process_command, sample_import_item_data, module_project
+):
+    """Test creating a new author."""
+    result = process_command._create_or_get_author(
+        sample_import_item_data.author, module_project.workspace_id
+    )
 
-        source_service = SourceService(process_command.db)
-        source = source_service.create_source(
-            SourceCreate(name="Test Source", identifier="github"),
-            setup_project.workspace_id,
-        )
+    assert result is not None
+    assert result.email == sample_import_item_data.author.email
+    assert result.display_name == sample_import_item_data.author.display_name
+
+
+def test_create_or_get_author_existing_author(
+    process_command, sample_import_item_data, module_project, preseeded_author
+):
+    """Test getting an existing author by external ID through source_authors."""
+    # Create the source and the source_author relationship with the same
+    # external ID in one flush
+    source = _test_source(module_project)
+    seed_rows(
+        process_command.db,
+        source,
+        SourceAuthor(
+            author_id=preseeded_author.id,
+            source=source,
+            source_author_id=sample_import_item_data.author.id,
+        ),
+    )
 
-        source_author_service = SourceAuthorService(process_command.db)
-        source_author = source_author_service.get_or_create_source_author(
-            source.id, author.id, "external_author_123"
-        )
+    # Now test getting the existing author by external ID
+    result = process_command._create_or_get_author(
+        sample_import_item_data.author, module_project.workspace_id, source.id
+    )
 
-        entry_service = EntryService(process_command.db)
-        entry = entry_service.create_entry(
-            EntryCreate(
-                title=sample_import_item_data.title,
-                body=sample_import_item_data.body,
-                source_id=source.id,
-                external_id="external_entry_123",
-                source_author_id=source_author.id,
-                project_id=setup_project.id,
-                source_created_at=sample_import_item_data.created_at,
-                source_updated_at=sample_import_item_data.updated_at,
-            )
-        )
+    assert result.id == preseeded_author.id
+    assert result.email == preseeded_author.email
 
-        result = process_command._create_entry_updates(
-            sample_import_item_data, entry.id, setup_project.workspace_id, source.id
-        )
 
-        # Should create no entry updates since entry_updates field is empty
-        assert len(result) == 0
+def test_create_or_get_source_author(process_command, module_source, preseeded_author):
+    """Test creating or getting a source author."""
+    source_author_id = "external_author_123"
 
-    def test_execute_with_comments_success(
-        self,
-        process_command,
-        setup_project,
-        sample_import_item_data_with_comments,
-        test_user,
-    ):
-        """Test successful processing of an import item with entry updates."""
-        # Create a proper import request item with the correct payload
-        from app.models.import_request_item import ImportRequestItem
-        from app.models.import_request import ImportRequest
-        from app.models.source import Source
-
-        # Create source first
-        source = Source(
-            name="Test Source",
-            identifier="github",
-            workspace_id=setup_project.workspace_id,
-        )
-        process_command.db.add(source)
-        process_command.db.commit()
-        process_command.db.refresh(source)
-
-        # Create import request
-        import_request = ImportRequest(
-            source_id=source.id,
-            requested_by_id=test_user.id,
-            status="pending",
-            received_count=1,
-            success_count=0,
-            failure_count=0,
-            project_id=setup_project.id,
-        )
-        process_command.db.add(import_request)
-        process_command.db.commit()
-        process_command.db.refresh(import_request)
-
-        # Create import request item with proper payload
-        import_request_item = ImportRequestItem(
-            import_request_id=import_request.id,
-            source_id=source.id,
-            source_item_id="item_123",
-            raw_payload=sample_import_item_data_with_comments.model_dump(),
-            status=ImportItemStatuses.FAILED,
-        )
-        process_command.db.add(import_request_item)
-        process_command.db.commit()
-        process_command.db.refresh(import_request_item)
-
-        # Execute the command
-        result = process_command.execute(import_request_item, setup_project)
-
-        # Assertions
-        assert result["success"] is True
-        assert "author_id" in result
-        assert "entry_id" in result
-        assert "entry_update_ids" in result
-        assert "source_author_id" in result
-        # Should have 2 entry updates created
-        assert len(result["entry_update_ids"]) == 2
-
-    def test_deduplication_prevents_duplicate_entries_and_entry_updates(
-        self,
-        process_command,
-        setup_project,
+    result = process_command._create_or_get_source_author(
+        preseeded_author.id, module_source.id, source_author_id
+    )
+
+    assert result is not None
+    assert result.author_id == preseeded_author.id
+    assert result.source_id == module_source.id
+    assert result.source_author_id == source_author_id
+
+
+def test_create_entry(
+    process_command, sample_import_item_data, module_project, preseeded_author
+):
+    """Test creating an entry."""
+    # First create required dependencies
+    source, source_author = _seed_entry_deps(
+        process_command.db, module_project, preseeded_author
+    )
+
+    result = process_command._create_entry(
+        sample_import_item_data,
+        source_author.id,
+        None,  # source_assignee_id
+        source.id,
+        module_project.id,
+        "external_entry_123",
+    )
+
+    assert result is not None
+    assert result.title == sample_import_item_data.title
+    assert result.body == sample_import_item_data.body
+    assert result.source_id == source.id
+    assert result.source_author_id == source_author.id
+    assert result.project_id == module_project.id
+
+
+def test_create_entry_updates_with_comments_field(
+    process_command, sample_import_item_data_with_comments, seeded_entry
+):
+    """Test creating entry updates when entry_updates field is present."""
+    source, entry = seeded_entry
+
+    result = process_command._create_entry_updates(
         sample_import_item_data_with_comments,
-        test_user,
-    ):
-        """Test that running import twice with same data updates existing entries/entry updates instead of creating duplicates."""
-        from app.models.import_request_item import ImportRequestItem
-        from app.models.import_request import ImportRequest
-        from app.models.source import Source
-
-        # Create source first
-        source = Source(
-            name="Test Source",
-            identifier="github",
-            workspace_id=setup_project.workspace_id,
-        )
-        process_command.db.add(source)
-        process_command.db.commit()
-        process_command.db.refresh(source)
-
-        # Create import request
-        import_request = ImportRequest(
-            source_id=source.id,
-            requested_by_id=test_user.id,
-            status="pending",
-            received_count=1,
-            success_count=0,
-            failure_count=0,
-            project_id=setup_project.id,
-        )
-        process_command.db.add(import_request)
-        process_command.db.commit()
-        process_command.db.refresh(import_request)
-
-        # Create import request item with proper payload
-        import_request_item = ImportRequestItem(
-            import_request_id=import_request.id,
-            source_id=source.id,
-            source_item_id="item_123",
-            raw_payload=sample_import_item_data_with_comments.model_dump(),
-            status=ImportItemStatuses.FAILED,
-        )
-        process_command.db.add(import_request_item)
-        process_command.db.commit()
-        process_command.db.refresh(import_request_item)
-
-        # Execute the command first time
-        result1 = process_command.execute(import_request_item, setup_project)
-        assert result1["success"] is True
-        first_entry_id = result1["entry_id"]
-        first_entry_update_ids = result1["entry_update_ids"]
-
-        # Execute the command second time with same data
-        result2 = process_command.execute(import_request_item, setup_project)
-        assert result2["success"] is True
-        second_entry_id = result2["entry_id"]
-        second_entry_update_ids = result2["entry_update_ids"]
-
-        # Should return the same entry and entry update IDs (updated, not duplicated)
-        assert first_entry_id == second_entry_id
-        assert first_entry_update_ids == second_entry_update_ids
-
-        # Verify only one entry exists in database
-        from app.services.entry_service import EntryService
-
-        entry_service = EntryService(process_command.db)
-        entries = entry_service.get_entries_by_project(setup_project.id)
-        entry_count = len([e for e in entries if e.external_id == "1"])
-        assert entry_count == 1
-
-        # Verify only expected number of entry updates exist in database
-        from app.services.entry_update_service import EntryUpdateService
-
-        entry_update_service = EntryUpdateService(process_command.db)
-        entry_updates = entry_update_service.get_entry_updates()
-        entry_update_count = len(
-            [
-                eu
-                for eu in entry_updates
-                if eu.external_id in ["1234567890", "1122334455"]
-            ]
-        )
-        assert entry_update_count == 2
+        entry.id,
+        source.workspace_id,
+        source.id,
+    )
+
+    # Should create 2 entry updates from the entry_updates field
+    assert len(result) == 2
+
+    # Check first entry update
+    assert result[0].body == "I am also experiencing this issue."
+    assert result[0].entry_id == entry.id
+    assert result[0].tags == ["bug", "api"]
+    assert result[0].labels == {"priority": "high"}
+
+    # Check second entry update
+    assert result[1].body == "I can reproduce this issue."
+    assert result[1].entry_id == entry.id
+    assert result[1].tags == ["bug", "api"]
+    assert result[1].labels == {"priority": "high"}
+
+
+def test_create_entry_updates_without_comments_field(
+    process_command, sample_import_item_data
+):
+    """Test creating entry updates when entry_updates field is empty."""
+    # Returns before any lookup, so the ids do not need to exist
+    result = process_command._create_entry_updates(
+        sample_import_item_data, uuid4(), uuid4(), uuid4()
+    )
+
+    # Should create no entry updates since entry_updates field is empty
+    assert len(result) == 0
+
+
+def test_deduplication_prevents_duplicate_entries_and_entry_updates(
+    process_command,
+    module_project,
+    module_source,
+    module_import_request,
+    sample_import_item_payload_with_comments,
+):
+    """Test that running import twice with same data updates existing entries/entry updates instead of creating duplicates."""
+    # Source and import request are shared module fixtures
+    import_request_item = _import_request_item(
+        module_source,
+        module_import_request,
+        sample_import_item_payload_with_comments,
+    )
+    seed_rows(process_command.db, import_request_item)
+
+    # Execute the command first time
+    result1 = process_command.execute(import_request_item, module_project)
+    assert result1["success"] is True
+    first_entry_id = result1["entry_id"]
+    first_entry_update_ids = result1["entry_update_ids"]
+
+    # Execute the command second time with same data
+    result2 = process_command.execute(import_request_item, module_project)
+    assert result2["success"] is True
+    second_entry_id = result2["entry_id"]
+    second_entry_update_ids = result2["entry_update_ids"]
+
+    # Should return the same entry and entry update IDs (updated, not duplicated)
+    assert first_entry_id == second_entry_id
+    assert first_entry_update_ids == second_entry_update_ids
+
+    # Verify only one entry exists in database
+    entry_service = process_command.entry_service
+    assert entry_service.count_entries_by_external_id(module_project.id, "1") == 1
+
+    # Verify only expected number of entry updates exist in database
+    entry_update_service = process_command.entry_update_service
+    assert (
+        entry_update_service.count_entry_updates_by_external_ids(
+            module_source.id, ["1234567890", "1122334455"]
+        )
+        == 2
+    )
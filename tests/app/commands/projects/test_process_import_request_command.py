@@ -1,12 +1,30 @@
 import pytest
-from uuid import uuid4
+from unittest.mock import ANY
+from uuid import UUID
 
 from app.commands.projects.process_import_request_command import (
     ProcessImportRequestCommand,
 )
 from app.models.import_request import ImportRequest
 from app.models.import_request_item import ImportRequestItem
+from app.schemas.project_import import ImportItemData, ImportAuthorData
 from app.constants.import_constants import ImportRequestStatuses, ImportItemStatuses
+from tests.fixtures.import_request_fixtures import seed_rows
+
+
+# Ids are generated with uuid4, which never produces the nil UUID
+_MISSING_ID = UUID(int=0)
+
+# Shape of a processed item whose payload failed validation
+_FAILED_ITEM = {
+    "item_id": ANY,
+    "success": False,
+    "author_id": None,
+    "entry_id": None,
+    "entry_update_ids": [],
+    "source_author_id": None,
+    "error": ANY,
+}
 
 
 @pytest.fixture
@@ -15,23 +33,77 @@ def process_request_command(db):
     return ProcessImportRequestCommand(db)
 
 
+@pytest.fixture(scope="module")
+def valid_item_payload():
+    """Raw payload of an item that imports cleanly, dumped once per module."""
+    return ImportItemData(
+        id="valid_item",
+        source="github",
+        title="Valid Item",
+        body="This is a valid item",
+        tags=["test"],
+        labels={"priority": "high"},
+        created_at="2025-01-01T00:00:00Z",
+        updated_at="2025-01-01T00:00:00Z",
+        author=ImportAuthorData(
+            id="valid_author",
+            display_name="Valid Author",
+            email="valid@example.com",
+            avatar_url="https://example.com/avatar.png",
+            tags=["developer"],
+            labels={"role": "maintainer"},
+            meta_data={"github_username": "validauthor"},
+        ),
+    ).model_dump()
+
+
+def _invalid_items(import_request, count):
+    """Build ``count`` unsaved items whose payloads fail validation."""
+    return [
+        ImportRequestItem(
+            import_request_id=import_request.id,
+            source_id=import_request.source_id,
+            source_item_id=f"invalid_item_{i}",
+            raw_payload={"invalid": f"data{i}"},
+            status=ImportItemStatuses.FAILED,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def import_request_items(db, module_import_request):
+    """Seed three items with payloads that fail validation."""
+    items = _invalid_items(module_import_request, 3)
+    seed_rows(db, *items)
+    return items
+
+
 class TestProcessImportRequestCommand:
-    """Test cases for ProcessImportRequestCommand."""
+    """Test cases for ProcessImportRequestCommand.
+
+    All tests share a module-scoped project, source and import request; the
+    items each test creates and the updates the command makes are rolled back
+    with it.
+    """
 
     def test_execute_success(
         self,
         process_request_command,
-        setup_import_request,
-        setup_import_request_with_items,
-        setup_project,
+        module_import_request,
+        import_request_items,
+        module_project,
+        db,
     ):
-        """Test successful processing of an import request."""
+        """Test processing an import request, its processed items and stored status."""
         # Execute the command
-        result = process_request_command.execute(setup_import_request.id, setup_project)
+        result = process_request_command.execute(
+            module_import_request.id, module_project
+        )
 
         # Assertions
         assert result["success"] is True
-        assert result["import_request_id"] == setup_import_request.id
+        assert result["import_request_id"] == module_import_request.id
         assert result["total_items"] == 3  # The fixture creates 3 items
         assert result["success_count"] == 0  # All items will fail due to invalid data
         assert result["failure_count"] == 3
@@ -39,64 +111,44 @@ class TestProcessImportRequestCommand:
         assert len(result["processed_items"]) == 3
         assert len(result["errors"]) == 3
 
+        # Check processed items structure
+        # All items fail due to invalid fixture data
+        for item in result["processed_items"]:
+            assert item == _FAILED_ITEM
+
+        # Verify the import request was updated in the database
+        updated_request = (
+            db.query(ImportRequest)
+            .filter(ImportRequest.id == module_import_request.id)
+            .first()
+        )
+        assert updated_request.status == ImportRequestStatuses.COMPLETED_WITH_ERRORS
+        assert updated_request.success_count == 0
+        assert updated_request.failure_count == 3
+
     def test_execute_with_failures(
-        self, process_request_command, setup_import_request, setup_project, db
+        self,
+        process_request_command,
+        module_import_request,
+        module_project,
+        db,
+        valid_item_payload,
     ):
         """Test processing with some failures."""
-        from app.schemas.project_import import ImportItemData, ImportAuthorData
-
         # Create one valid item and one invalid item
-        source_id = setup_import_request.source_id
-
-        # Valid item
-        valid_item_data = ImportItemData(
-            id="valid_item",
-            source="github",
-            title="Valid Item",
-            body="This is a valid item",
-            tags=["test"],
-            labels={"priority": "high"},
-            created_at="2025-01-01T00:00:00Z",
-            updated_at="2025-01-01T00:00:00Z",
-            author=ImportAuthorData(
-                id="valid_author",
-                display_name="Valid Author",
-                email="valid@example.com",
-                avatar_url="https://example.com/avatar.png",
-                tags=["developer"],
-                labels={"role": "maintainer"},
-                meta_data={"github_username": "validauthor"},
-            ),
-        )
-
-        # Invalid item (missing required fields)
-        invalid_item_data = {"invalid": "data"}
-
-        # Create items
         valid_item = ImportRequestItem(
-            import_request_id=setup_import_request.id,
-            source_id=source_id,
+            import_request_id=module_import_request.id,
+            source_id=module_import_request.source_id,
             source_item_id="valid_item",
-            raw_payload=valid_item_data.model_dump(),
+            raw_payload=valid_item_payload,
             status=ImportItemStatuses.FAILED,
         )
-
-        invalid_item = ImportRequestItem(
-            import_request_id=setup_import_request.id,
-            source_id=source_id,
-            source_item_id="invalid_item",
-            raw_payload=invalid_item_data,
-            status=ImportItemStatuses.FAILED,
-        )
-
-        db.add(valid_item)
-        db.add(invalid_item)
-        db.commit()
-        db.refresh(valid_item)
-        db.refresh(invalid_item)
+        seed_rows(db, valid_item, *_invalid_items(module_import_request, 1))
 
         # Execute the command
-        result = process_request_command.execute(setup_import_request.id, setup_project)
+        result = process_request_command.execute(
+            module_import_request.id, module_project
+        )
 
         # Assertions
         assert result["success"] is True
@@ -108,65 +160,40 @@ class TestProcessImportRequestCommand:
         assert len(result["errors"]) == 1
 
     def test_execute_import_request_not_found(
-        self, process_request_command, setup_project
+        self, process_request_command, module_project
     ):
         """Test processing when import request is not found."""
         # Execute the command with a non-existent import request ID
-        result = process_request_command.execute(uuid4(), setup_project)
+        result = process_request_command.execute(_MISSING_ID, module_project)
 
         # Assertions
         assert result["success"] is False
         assert "not found" in result["error"]
 
     def test_execute_no_items(
-        self, process_request_command, setup_import_request, setup_project, db
+        self, process_request_command, module_import_request, module_project
     ):
         """Test processing when no items are found."""
-        # Delete all items for this import request
-        db.query(ImportRequestItem).filter(
-            ImportRequestItem.import_request_id == setup_import_request.id
-        ).delete()
-        db.commit()
-
-        # Execute the command
-        result = process_request_command.execute(setup_import_request.id, setup_project)
+        # Items are only ever seeded per test, so the shared request has none
+        result = process_request_command.execute(
+            module_import_request.id, module_project
+        )
 
         # Assertions
         assert result["success"] is False
         assert "No items found" in result["error"]
 
     def test_execute_with_exception(
-        self, process_request_command, setup_import_request, setup_project, db
+        self, process_request_command, module_import_request, module_project, db
     ):
         """Test processing when an exception occurs during item processing."""
-        # Create items with data that will cause processing errors
-        source_id = setup_import_request.source_id
-
         # Create items with invalid data that will cause validation errors
-        invalid_item1 = ImportRequestItem(
-            import_request_id=setup_import_request.id,
-            source_id=source_id,
-            source_item_id="invalid_item_1",
-            raw_payload={"invalid": "data1"},
-            status=ImportItemStatuses.FAILED,
-        )
-
-        invalid_item2 = ImportRequestItem(
-            import_request_id=setup_import_request.id,
-            source_id=source_id,
-            source_item_id="invalid_item_2",
-            raw_payload={"invalid": "data2"},
-            status=ImportItemStatuses.FAILED,
-        )
-
-        db.add(invalid_item1)
-        db.add(invalid_item2)
-        db.commit()
-        db.refresh(invalid_item1)
-        db.refresh(invalid_item2)
+        seed_rows(db, *_invalid_items(module_import_request, 2))
 
         # Execute the command
-        result = process_request_command.execute(setup_import_request.id, setup_project)
+        result = process_request_command.execute(
+            module_import_request.id, module_project
+        )
 
         # Assertions
         assert result["success"] is True  # Command itself succeeds
@@ -179,43 +206,21 @@ class TestProcessImportRequestCommand:
     def test_execute_batch_success(
         self,
         process_request_command,
-        setup_project,
+        module_project,
         db,
-        setup_import_request,
-        setup_source,
+        module_import_request,
+        module_source,
+        valid_item_payload,
     ):
         """Test successful batch processing of multiple import requests."""
-        from app.schemas.project_import import ImportItemData, ImportAuthorData
-
         # Create first import request with valid items
-        import_request1 = setup_import_request
-
-        # Create valid items for first request
-        item_data = ImportItemData(
-            id="valid_item",
-            source="github",
-            title="Test Item",
-            body="This is a test item",
-            tags=["test"],
-            labels={"priority": "high"},
-            created_at="2025-01-01T00:00:00Z",
-            updated_at="2025-01-01T00:00:00Z",
-            author=ImportAuthorData(
-                id="test_author",
-                display_name="Test Author",
-                email="test@example.com",
-                avatar_url="https://example.com/avatar.png",
-                tags=["developer"],
-                labels={"role": "maintainer"},
-                meta_data={"github_username": "testauthor"},
-            ),
-        )
+        import_request1 = module_import_request
 
         item1 = ImportRequestItem(
             import_request_id=import_request1.id,
             source_id=import_request1.source_id,
             source_item_id="item_1",
-            raw_payload=item_data.model_dump(),
+            raw_payload=valid_item_payload,
             status=ImportItemStatuses.FAILED,
         )
 
@@ -227,28 +232,23 @@ class TestProcessImportRequestCommand:
             received_count=1,
             success_count=0,
             failure_count=0,
-            project_id=setup_project.id,
+            project_id=module_project.id,
             options={},
         )
-        db.add(import_request2)
-        db.commit()
-        db.refresh(import_request2)
 
         item2 = ImportRequestItem(
-            import_request_id=import_request2.id,
+            import_request=import_request2,
             source_id=import_request1.source_id,
             source_item_id="item_2",
-            raw_payload=item_data.model_dump(),
+            raw_payload=valid_item_payload,
             status=ImportItemStatuses.FAILED,
         )
 
-        db.add(item1)
-        db.add(item2)
-        db.commit()
+        seed_rows(db, import_request2, item1, item2)
 
         # Execute the batch command
         result = process_request_command.execute_batch(
-            [import_request1.id, import_request2.id], setup_project
+            [import_request1.id, import_request2.id], module_project
         )
 
         # Assertions
@@ -262,43 +262,21 @@ class TestProcessImportRequestCommand:
     def test_execute_batch_with_failures(
         self,
         process_request_command,
-        setup_project,
+        module_project,
         db,
-        setup_import_request,
-        setup_source,
+        module_import_request,
+        module_source,
+        valid_item_payload,
     ):
         """Test batch processing with some failures."""
-        from app.schemas.project_import import ImportItemData, ImportAuthorData
-
         # Create first import request with valid item
-        import_request1 = setup_import_request
-
-        # Create valid item for first request
-        valid_item_data = ImportItemData(
-            id="valid_item",
-            source="github",
-            title="Valid Item",
-            body="This is a valid item",
-            tags=["test"],
-            labels={"priority": "high"},
-            created_at="2025-01-01T00:00:00Z",
-            updated_at="2025-01-01T00:00:00Z",
-            author=ImportAuthorData(
-                id="valid_author",
-                display_name="Valid Author",
-                email="valid@example.com",
-                avatar_url="https://example.com/avatar.png",
-                tags=["developer"],
-                labels={"role": "maintainer"},
-                meta_data={"github_username": "validauthor"},
-            ),
-        )
+        import_request1 = module_import_request
 
         valid_item = ImportRequestItem(
             import_request_id=import_request1.id,
             source_id=import_request1.source_id,
             source_item_id="valid_item",
-            raw_payload=valid_item_data.model_dump(),
+            raw_payload=valid_item_payload,
             status=ImportItemStatuses.FAILED,
         )
 
@@ -310,29 +288,24 @@ class TestProcessImportRequestCommand:
             received_count=1,
             success_count=0,
             failure_count=0,
-            project_id=setup_project.id,
+            project_id=module_project.id,
             options={},
         )
-        db.add(import_request2)
-        db.commit()
-        db.refresh(import_request2)
 
         # Create invalid item for second request
         invalid_item = ImportRequestItem(
-            import_request_id=import_request2.id,
+            import_request=import_request2,
             source_id=import_request1.source_id,
             source_item_id="invalid_item",
             raw_payload={"invalid": "data"},
             status=ImportItemStatuses.FAILED,
         )
 
-        db.add(valid_item)
-        db.add(invalid_item)
-        db.commit()
+        seed_rows(db, import_request2, valid_item, invalid_item)
 
         # Execute the batch command
         result = process_request_command.execute_batch(
-            [import_request1.id, import_request2.id], setup_project
+            [import_request1.id, import_request2.id], module_project
         )
 
         # Assertions
@@ -345,103 +318,20 @@ class TestProcessImportRequestCommand:
         assert result["total_failure"] == 1  # 1 invalid item from second request
         assert len(result["results"]) == 2
 
-    def test_status_updates(
-        self,
-        process_request_command,
-        setup_import_request,
-        setup_import_request_with_items,
-        setup_project,
-        db,
-    ):
-        """Test that import request status is updated correctly."""
-        # Execute the command
-        result = process_request_command.execute(setup_import_request.id, setup_project)
-
-        # Verify the result shows processing with errors (due to invalid fixture data)
-        assert result["success"] is True
-        assert result["status"] == ImportRequestStatuses.COMPLETED_WITH_ERRORS
-        assert result["success_count"] == 0
-        assert result["failure_count"] == 3
-
-        # Verify the import request was updated in the database
-        updated_request = (
-            db.query(ImportRequest)
-            .filter(ImportRequest.id == setup_import_request.id)
-            .first()
-        )
-        assert updated_request.status == ImportRequestStatuses.COMPLETED_WITH_ERRORS
-        assert updated_request.success_count == 0
-        assert updated_request.failure_count == 3
-
-    def test_processed_items_structure(
-        self,
-        process_request_command,
-        setup_import_request,
-        setup_import_request_with_items,
-        setup_project,
-    ):
-        """Test the structure of processed items in the result."""
-        # Execute the command
-        result = process_request_command.execute(setup_import_request.id, setup_project)
-
-        # Check processed items structure
-        assert len(result["processed_items"]) == 3
-
-        for item in result["processed_items"]:
-            assert "item_id" in item
-            assert "success" in item
-            assert (
-                item["success"] is False
-            )  # All items will fail due to invalid fixture data
-            assert "error" in item
-            assert item.get("author_id") is None  # No author_id for failed items
-            assert item.get("entry_id") is None  # No entry_id for failed items
-            assert item.get("entry_update_ids") == []  # Empty list for failed items
-            assert (
-                item.get("source_author_id") is None
-            )  # No source_author_id for failed items
-
     def test_processed_items_with_errors(
-        self, process_request_command, setup_import_request, setup_project, db
+        self, process_request_command, module_import_request, module_project, db
     ):
         """Test the structure of processed items when there are errors."""
         # Create items with invalid data that will cause processing errors
-        source_id = setup_import_request.source_id
-
-        # Delete existing items and create invalid ones
-        db.query(ImportRequestItem).filter(
-            ImportRequestItem.import_request_id == setup_import_request.id
-        ).delete()
-
-        invalid_item1 = ImportRequestItem(
-            import_request_id=setup_import_request.id,
-            source_id=source_id,
-            source_item_id="invalid_item_1",
-            raw_payload={"invalid": "data1"},
-            status=ImportItemStatuses.FAILED,
-        )
-
-        invalid_item2 = ImportRequestItem(
-            import_request_id=setup_import_request.id,
-            source_id=source_id,
-            source_item_id="invalid_item_2",
-            raw_payload={"invalid": "data2"},
-            status=ImportItemStatuses.FAILED,
-        )
-
-        db.add(invalid_item1)
-        db.add(invalid_item2)
-        db.commit()
+        seed_rows(db, *_invalid_items(module_import_request, 2))
 
         # Execute the command
-        result = process_request_command.execute(setup_import_request.id, setup_project)
+        result = process_request_command.execute(
+            module_import_request.id, module_project
+        )
 
         # Check processed items structure
         assert len(result["processed_items"]) == 2
 
         for item in result["processed_items"]:
-            assert "item_id" in item
-            assert "success" in item
-            assert item["success"] is False
-            assert "error" in item
-            assert item.get("author_id") is None  # No author_id for failed items
+            assert item == _FAILED_ITEM
@@ -15,9 +15,23 @@ class TestBackfillDigestsCommand:
         """Create a BackfillDigestsCommand instance."""
         return BackfillDigestsCommand(db)
 
+    @pytest.fixture
+    def digest_service(self):
+        """A mock DigestService; tests set what get_digests_by_config returns."""
+        return Mock()
+
+    @pytest.fixture
+    def command_with_digest_service(self, db, digest_service):
+        """A BackfillDigestsCommand using the mock digest_service."""
+        return BackfillDigestsCommand(db, digest_service=digest_service)
+
     @pytest.fixture
     def daily_config(self, setup_digest_generation_config):
-        """A digest generation config that runs daily."""
+        """A digest generation config that runs daily.
+
+        Changes to the config are not committed; the command loads it through
+        the same session, so it sees them from the identity map.
+        """
         config = setup_digest_generation_config
         config.cron_expression = "0 10 * * *"  # Daily at 10 AM
         config.timezone = "UTC"
@@ -41,11 +55,10 @@ class TestBackfillDigestsCommand:
         ):
             backfill_command.execute(non_existent_id, 3)
 
-    def test_execute_with_invalid_cron(self, backfill_command, daily_config, db):
+    def test_execute_with_invalid_cron(self, backfill_command, daily_config):
         """Test that execute raises ValueError for invalid cron expression."""
         # Set invalid cron expression
         daily_config.cron_expression = "invalid cron"
-        db.commit()
 
         with pytest.raises(ValueError, match="Invalid cron expression"):
             backfill_command.execute(daily_config.id, 3)
@@ -71,7 +84,7 @@ class TestBackfillDigestsCommand:
 
             # Verify that generate command was called
             assert mock_generate_command.execute.called
-            assert len(result.created_digests) >= 0  # Should have created some digests
+            assert result.created_count >= 0  # Should have created some digests
 
     def test_execute_weekly_backfill(self, backfill_command, weekly_config):
         """Test backfilling digests for a weekly configuration."""
@@ -94,7 +107,7 @@ class TestBackfillDigestsCommand:
 
             # Verify that generate command was called
             assert mock_generate_command.execute.called
-            assert len(result.created_digests) >= 0  # Should have created some digests
+            assert result.created_count >= 0  # Should have created some digests
 
     def test_calculate_execution_times_daily(self, backfill_command):
         """Test calculation of execution times for daily cron."""
@@ -131,45 +144,44 @@ class TestBackfillDigestsCommand:
         result = backfill_command._matches_cron_pattern_simple(cron, match_time)
         assert isinstance(result, bool)  # Just check it returns a boolean
 
-    def test_digest_exists_for_time_period(self, backfill_command, daily_config):
+    def test_digest_exists_for_time_period(
+        self, command_with_digest_service, digest_service, daily_config
+    ):
         """Test checking if digest exists for a time period."""
-        with patch("app.services.digest_service.DigestService") as mock_digest_service:
-            # Mock existing digest with overlapping date range
-            mock_digest = Mock()
-            mock_digest.from_date = datetime(2023, 10, 9, 0, 0, 0, tzinfo=pytz.UTC)
-            mock_digest.to_date = datetime(2023, 10, 10, 0, 0, 0, tzinfo=pytz.UTC)
+        # Mock existing digest with overlapping date range
+        mock_digest = Mock()
+        mock_digest.from_date = datetime(2023, 10, 9, 0, 0, 0, tzinfo=pytz.UTC)
+        mock_digest.to_date = datetime(2023, 10, 10, 0, 0, 0, tzinfo=pytz.UTC)
 
-            mock_service_instance = mock_digest_service.return_value
-            mock_service_instance.get_digests_by_config.return_value = [mock_digest]
+        digest_service.get_digests_by_config.return_value = [mock_digest]
 
-            execution_time = datetime(2023, 10, 10, 10, 0, 0, tzinfo=pytz.UTC)
+        execution_time = datetime(2023, 10, 10, 10, 0, 0, tzinfo=pytz.UTC)
 
-            result = backfill_command._digest_exists_for_time_period(
-                daily_config.id, execution_time
-            )
+        result = command_with_digest_service._digest_exists_for_time_period(
+            daily_config.id, execution_time
+        )
 
-            assert result is True
+        assert result is True
 
-    def test_digest_not_exists_for_time_period(self, backfill_command, daily_config):
+    def test_digest_not_exists_for_time_period(
+        self, command_with_digest_service, digest_service, daily_config
+    ):
         """Test checking when no digest exists for a time period."""
-        with patch("app.services.digest_service.DigestService") as mock_digest_service:
-            # Mock no existing digests
-            mock_service_instance = mock_digest_service.return_value
-            mock_service_instance.get_digests_by_config.return_value = []
+        # Mock no existing digests
+        digest_service.get_digests_by_config.return_value = []
 
-            execution_time = datetime(2023, 10, 10, 10, 0, 0, tzinfo=pytz.UTC)
+        execution_time = datetime(2023, 10, 10, 10, 0, 0, tzinfo=pytz.UTC)
 
-            result = backfill_command._digest_exists_for_time_period(
-                daily_config.id, execution_time
-            )
+        result = command_with_digest_service._digest_exists_for_time_period(
+            daily_config.id, execution_time
+        )
 
-            assert result is False
+        assert result is False
 
-    def test_execute_with_timezone(self, backfill_command, daily_config, db):
+    def test_execute_with_timezone(self, backfill_command, daily_config):
         """Test execute with different timezone."""
         # Set timezone to Eastern Time
         daily_config.timezone = "America/New_York"
-        db.commit()
 
         # This should not raise an exception
         with patch.object(
@@ -180,13 +192,12 @@ class TestBackfillDigestsCommand:
             test_date = datetime(2023, 10, 10, 15, 0, 0, tzinfo=pytz.UTC)  # 3 PM UTC
             result = backfill_command.execute(daily_config.id, 2, test_date)
 
-            assert hasattr(result, "created_digests")  # Check it's a BackfillResult
+            assert hasattr(result, "created_ids")  # Check it's a BackfillResult
 
-    def test_execute_with_invalid_timezone(self, backfill_command, daily_config, db):
+    def test_execute_with_invalid_timezone(self, backfill_command, daily_config):
         """Test execute with invalid timezone falls back to UTC."""
         # Set invalid timezone
         daily_config.timezone = "Invalid/Timezone"
-        db.commit()
 
         # This should not raise an exception and should fallback to UTC
         with patch.object(
@@ -197,7 +208,7 @@ class TestBackfillDigestsCommand:
             test_date = datetime(2023, 10, 10, 12, 0, 0, tzinfo=pytz.UTC)
             result = backfill_command.execute(daily_config.id, 1, test_date)
 
-            assert hasattr(result, "created_digests")  # Check it's a BackfillResult
+            assert hasattr(result, "created_ids")  # Check it's a BackfillResult
 
     def test_execute_skips_existing_digests(self, backfill_command, daily_config):
         """Test that execute skips creating digests that already exist."""
@@ -213,8 +224,9 @@ class TestBackfillDigestsCommand:
                 test_date = datetime(2023, 10, 10, 12, 0, 0, tzinfo=pytz.UTC)
                 result = backfill_command.execute(daily_config.id, 2, test_date)
 
-                # Should return result with empty created_digests since all digests already exist
-                assert len(result.created_digests) == 0
+                # Should return result with no created digests since all digests already exist
+                assert result.created_ids == []
+                assert result.created_count == 0
                 assert result.skipped_count > 0  # Should have skipped some
                 # Generate command should not be called
                 assert not mock_generate_command.execute.called
@@ -242,8 +254,9 @@ class TestBackfillDigestsCommand:
                     test_date = datetime(2023, 10, 10, 12, 0, 0, tzinfo=pytz.UTC)
                     result = backfill_command.execute(daily_config.id, 1, test_date)
 
-                    # Should return result with empty created_digests since generation failed
-                    assert len(result.created_digests) == 0
+                    # Should return result with no created digests since generation failed
+                    assert result.created_ids == []
+                    assert result.created_count == 0
                     assert result.failed_count > 0  # Should have failed some
                     # Generate command should have been called but failed
                     assert mock_generate_command.execute.called
@@ -275,13 +288,16 @@ class TestBackfillDigestsCommand:
                     )
 
                     # Should have deleted 2 digests and created 1 new digest
-                    assert len(result.created_digests) == 1
+                    assert len(result.created_ids) == 1
+                    assert result.created_count == 1
                     assert result.deleted_count == 2
                     assert result.skipped_count == 0  # No skips when force=True
                     # Generate command should have been called
                     assert mock_generate_command.execute.called
 
-    def test_delete_overlapping_digests(self, backfill_command, daily_config):
+    def test_delete_overlapping_digests(
+        self, command_with_digest_service, digest_service, daily_config
+    ):
         """Test the _delete_overlapping_digests method."""
         execution_time = datetime(2023, 10, 10, 10, 0, 0, tzinfo=pytz.UTC)
 
@@ -291,22 +307,20 @@ class TestBackfillDigestsCommand:
         mock_digest.from_date = datetime(2023, 10, 9, 0, 0, 0, tzinfo=pytz.UTC)
         mock_digest.to_date = datetime(2023, 10, 10, 0, 0, 0, tzinfo=pytz.UTC)
 
-        with patch("app.services.digest_service.DigestService") as mock_digest_service:
-            mock_service_instance = mock_digest_service.return_value
-            mock_service_instance.get_digests_by_config.return_value = [mock_digest]
-            mock_service_instance.delete_digest.return_value = True
+        digest_service.get_digests_by_config.return_value = [mock_digest]
+        digest_service.delete_digest.return_value = True
 
-            deleted_count = backfill_command._delete_overlapping_digests(
-                daily_config.id, execution_time
-            )
+        deleted_count = command_with_digest_service._delete_overlapping_digests(
+            daily_config.id, execution_time
+        )
 
-            # Should have deleted 1 digest
-            assert deleted_count == 1
-            # Delete method should have been called with the digest ID
-            mock_service_instance.delete_digest.assert_called_once()
+        # Should have deleted 1 digest
+        assert deleted_count == 1
+        # Delete method should have been called with the digest ID
+        digest_service.delete_digest.assert_called_once_with(mock_digest.id)
 
     def test_delete_overlapping_digests_no_overlap(
-        self, backfill_command, daily_config
+        self, command_with_digest_service, digest_service, daily_config
     ):
         """Test the _delete_overlapping_digests method when there's no overlap."""
         execution_time = datetime(2023, 10, 10, 10, 0, 0, tzinfo=pytz.UTC)
@@ -317,16 +331,14 @@ class TestBackfillDigestsCommand:
         mock_digest.from_date = datetime(2023, 10, 7, 0, 0, 0, tzinfo=pytz.UTC)
         mock_digest.to_date = datetime(2023, 10, 8, 0, 0, 0, tzinfo=pytz.UTC)
 
-        with patch("app.services.digest_service.DigestService") as mock_digest_service:
-            mock_service_instance = mock_digest_service.return_value
-            mock_service_instance.get_digests_by_config.return_value = [mock_digest]
-            mock_service_instance.delete_digest.return_value = True
+        digest_service.get_digests_by_config.return_value = [mock_digest]
+        digest_service.delete_digest.return_value = True
 
-            deleted_count = backfill_command._delete_overlapping_digests(
-                daily_config.id, execution_time
-            )
+        deleted_count = command_with_digest_service._delete_overlapping_digests(
+            daily_config.id, execution_time
+        )
 
-            # Should not have deleted any digests
-            assert deleted_count == 0
-            # Delete method should not have been called
-            mock_service_instance.delete_digest.assert_not_called()
+        # Should not have deleted any digests
+        assert deleted_count == 0
+        # Delete method should not have been called
+        digest_service.delete_digest.assert_not_called()
@@ -48,7 +48,8 @@ class TestDigestGenerationConfigBackfillEndpoint:
 
         # Mock the command result
         mock_result = BackfillResult(
-            created_digests=[mock_digest],
+            created_ids=[mock_digest.id],
+            created_count=1,
             skipped_count=2,
             failed_count=0,
             deleted_count=0,
@@ -64,7 +65,8 @@ class TestDigestGenerationConfigBackfillEndpoint:
                 force=False,
             )
 
-            assert len(result.created_digests) == 1
+            assert result.created_ids == [mock_digest.id]
+            assert result.created_count == 1
             assert result.skipped_count == 2
             assert result.failed_count == 0
             assert result.deleted_count == 0
@@ -99,7 +101,11 @@ class TestDigestGenerationConfigBackfillEndpoint:
         config = setup_digest_generation_config
 
         mock_result = BackfillResult(
-            created_digests=[], skipped_count=0, failed_count=0, deleted_count=0
+            created_ids=[],
+            created_count=0,
+            skipped_count=0,
+            failed_count=0,
+            deleted_count=0,
         )
 
         with patch.object(
@@ -113,7 +119,8 @@ class TestDigestGenerationConfigBackfillEndpoint:
                 force=False,
             )
 
-            assert len(result.created_digests) == 0
+            assert result.created_ids == []
+            assert result.created_count == 0
             assert result.skipped_count == 0
             assert result.failed_count == 0
             assert result.deleted_count == 0
@@ -68,6 +68,17 @@ def test_delete_entry(db, setup_entry):
     assert service.get_entry(entry.id) is None
 
 
+def test_count_entries_by_external_id(db, setup_entry):
+    service = EntryService(db)
+    entry = setup_entry
+
+    assert (
+        service.count_entries_by_external_id(entry.project_id, entry.external_id) == 1
+    )
+    assert service.count_entries_by_external_id(entry.project_id, "missing") == 0
+    assert service.count_entries_by_external_id(uuid4(), entry.external_id) == 0
+
+
 def test_search_entries(db, setup_entry):
     service = EntryService(db)
     entry = setup_entry
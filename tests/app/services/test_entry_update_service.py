@@ -69,6 +69,35 @@ def test_delete_entry_update(db, setup_entry_update):
     assert service.get_entry_update(entry_update.id) is None
 
 
+def test_get_entry_updates_by_external_ids(db, setup_entry_update):
+    service = EntryUpdateService(db)
+    entry_update = setup_entry_update
+    source_id = entry_update.source_id
+
+    results = service.get_entry_updates_by_external_ids(
+        source_id, [entry_update.external_id, "missing"]
+    )
+    assert [result.id for result in results] == [entry_update.id]
+    assert (
+        service.get_entry_updates_by_external_ids(uuid4(), [entry_update.external_id])
+        == []
+    )
+
+
+def test_count_entry_updates_by_external_ids(db, setup_entry_update):
+    service = EntryUpdateService(db)
+    entry_update = setup_entry_update
+    source_id = entry_update.source_id
+
+    assert (
+        service.count_entry_updates_by_external_ids(
+            source_id, [entry_update.external_id, "missing"]
+        )
+        == 1
+    )
+    assert service.count_entry_updates_by_external_ids(source_id, ["missing"]) == 0
+
+
 def test_search_entry_updates(db, setup_entry_update):
     service = EntryUpdateService(db)
     entry_update = setup_entry_update
@@ -1,4 +1,5 @@
 from uuid import uuid4
+from app.services import import_request_service
 from app.services.import_request_service import ImportRequestService
 from app.schemas.import_request import (
     ImportRequestCreate,
@@ -29,6 +30,21 @@ class TestImportRequestService:
         result = service.get_import_request(uuid4())
         assert result is None
 
+    def test_get_import_request_with_project(self, db, setup_import_request):
+        """Test getting an import request with its project eagerly loaded."""
+        import_request_id = setup_import_request.id
+        project_id = setup_import_request.project_id
+        db.expunge_all()
+
+        service = ImportRequestService(db)
+        result = service.get_import_request_with_project(import_request_id)
+
+        assert result is not None
+        assert result.id == import_request_id
+        # The project is populated by the query itself, not lazily on access
+        assert "project" in result.__dict__
+        assert result.project.id == project_id
+
     def test_get_import_requests(
         self, db, setup_import_request, setup_another_import_request
     ):
@@ -207,6 +223,71 @@ class TestImportRequestService:
         assert result.source.id == source.id
         assert result.status == "pending"
 
+    def test_create_import_request_items(
+        self, db, setup_import_request, setup_source, faker
+    ):
+        """Test creating several import request items at once."""
+        source = setup_source
+        import_request = setup_import_request
+
+        service = ImportRequestService(db)
+        items_data = [
+            ImportRequestItemCreate(
+                import_request_id=import_request.id,
+                source_id=source.id,
+                source_item_id=str(faker.uuid4()),
+                raw_payload={"title": f"Test Item {i}"},
+                status="pending",
+            )
+            for i in range(3)
+        ]
+
+        created = service.create_import_request_items(items_data)
+
+        assert created == 3
+        results = service.get_import_request_items(import_request.id)
+        assert len(results) == 3
+        assert {item.source_item_id for item in results} == {
+            item.source_item_id for item in items_data
+        }
+        assert all(item.id is not None for item in results)
+        assert all(item.status == "pending" for item in results)
+
+    def test_create_import_request_items_with_copy(
+        self, db, setup_import_request, setup_source, faker, monkeypatch
+    ):
+        """Test that large batches of import request items are loaded with COPY."""
+        monkeypatch.setattr(import_request_service, "COPY_THRESHOLD", 1)
+        source = setup_source
+        import_request = setup_import_request
+
+        service = ImportRequestService(db)
+        items_data = [
+            ImportRequestItemCreate(
+                import_request_id=import_request.id,
+                source_id=source.id,
+                source_item_id=str(faker.uuid4()),
+                raw_payload={"title": f'Item "{i}", with quotes', "tags": ["a", "b"]},
+                status="pending",
+            )
+            for i in range(3)
+        ]
+
+        created = service.create_import_request_items(items_data)
+
+        assert created == 3
+        results = service.get_import_request_items(import_request.id)
+        payloads_by_id = {item.source_item_id: item.raw_payload for item in results}
+        assert payloads_by_id == {
+            item.source_item_id: item.raw_payload for item in items_data
+        }
+        assert all(item.created_at is not None for item in results)
+
+    def test_create_import_request_items_empty(self, db):
+        """Test creating an empty list of import request items."""
+        service = ImportRequestService(db)
+        assert service.create_import_request_items([]) == 0
+
     def test_update_import_request_item(self, db, setup_import_request_item):
         """Test updating an import request item."""
         service = ImportRequestService(db)
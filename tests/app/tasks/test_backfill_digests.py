@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app.commands.digest.backfill_digests_command import BackfillResult
+from app.tasks.backfill_digests import backfill_digests_task
+
+
+@pytest.fixture
+def mock_command():
+    """Patch the backfill command (and the session) used by the task."""
+    with patch("app.tasks.backfill_digests.SessionLocal"):
+        with patch("app.tasks.backfill_digests.BackfillDigestsCommand") as command_cls:
+            command_cls.return_value.execute.return_value = BackfillResult(
+                created_ids=[],
+                created_count=0,
+                skipped_count=0,
+                failed_count=0,
+                deleted_count=0,
+            )
+            yield command_cls.return_value
+
+
+def test_backfill_digests_task_converts_timestamp_to_utc(mock_command):
+    """Test that start_from_timestamp reaches the command as a UTC datetime."""
+    start = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+    backfill_digests_task(
+        digest_generation_config_id=str(uuid4()),
+        days=3,
+        start_from_timestamp=start.timestamp(),
+    )
+
+    start_from_date = mock_command.execute.call_args.kwargs["start_from_date"]
+    assert start_from_date == start
+    assert start_from_date.tzinfo == timezone.utc
+
+
+def test_backfill_digests_task_accepts_legacy_start_from_date(mock_command):
+    """Test that the ISO start_from_date of older messages is still accepted."""
+    backfill_digests_task(
+        digest_generation_config_id=str(uuid4()),
+        days=3,
+        start_from_date="2025-03-01T14:30:00+02:00",
+    )
+
+    start_from_date = mock_command.execute.call_args.kwargs["start_from_date"]
+    assert start_from_date == datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+    assert start_from_date.tzinfo == timezone.utc
+
+
+def test_backfill_digests_task_without_start_date(mock_command):
+    """Test that no start date is passed when neither argument is given."""
+    backfill_digests_task(digest_generation_config_id=str(uuid4()), days=3)
+
+    assert mock_command.execute.call_args.kwargs["start_from_date"] is None
@@ -0,0 +1,36 @@
+from unittest.mock import patch
+
+from app.tasks.process_import_items import (
+    enqueue_import_items_bulk,
+    process_import_items_chunk,
+)
+
+
+def test_process_import_items_chunk_continues_after_failure():
+    """Test that one failing import request does not stop the rest of its chunk."""
+    ids = ["first", "second", "third"]
+
+    with patch(
+        "app.tasks.process_import_items.process_import_items",
+        side_effect=[RuntimeError("boom"), None, None],
+    ) as process:
+        process_import_items_chunk(ids)
+
+    assert [call.args[0] for call in process.call_args_list] == ids
+
+
+def test_enqueue_import_items_bulk_publishes_one_message_per_chunk():
+    """Test that ids are split into chunk_size sized process_import_items_chunk messages."""
+    with patch("app.tasks.process_import_items.group") as group:
+        enqueue_import_items_bulk([f"id-{i}" for i in range(5)], chunk_size=2)
+
+    signatures = list(group.call_args.args[0])
+    assert [signature.args[0] for signature in signatures] == [
+        ["id-0", "id-1"],
+        ["id-2", "id-3"],
+        ["id-4"],
+    ]
+    assert {signature.task for signature in signatures} == {
+        "app.tasks.process_import_items.process_import_items_chunk"
+    }
+    group.return_value.apply_async.assert_called_once_with()
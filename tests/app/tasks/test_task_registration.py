@@ -0,0 +1,18 @@
+import app.tasks  # noqa: F401
+from app.core.celery_app import celery_app
+
+
+def test_process_import_items_registered_once():
+    """Test that process_import_items is registered under a single task name."""
+    registered = {
+        name for name in celery_app.tasks if name.endswith("process_import_items")
+    }
+    assert registered == {"app.tasks.process_import_items.process_import_items"}
+
+
+def test_backfill_digests_task_registered_once():
+    """Test that backfill_digests_task is registered under a single task name."""
+    registered = {
+        name for name in celery_app.tasks if name.endswith("backfill_digests_task")
+    }
+    assert registered == {"app.tasks.backfill_digests.backfill_digests_task"}
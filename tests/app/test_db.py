@@ -0,0 +1,49 @@
+import math
+from datetime import datetime, timezone
+
+import pytest
+
+from app.constants.import_constants import ImportItemStatuses
+from app.db import json_serializer
+from app.models.import_request_item import ImportRequestItem
+from tests.fixtures.import_request_fixtures import seed_rows
+
+
+def test_json_column_round_trip(db, setup_import_request):
+    """Test that a JSONB payload is read back exactly as it was written."""
+    payload = {
+        "title": "Ünïcode title ✓",
+        "count": 3,
+        "ratio": 0.25,
+        "draft": False,
+        "closed_at": None,
+        "labels": ["bug", "p1"],
+        "author": {"id": "123", "meta": {"nested": [1, {"deep": True}]}},
+    }
+    item = ImportRequestItem(
+        import_request_id=setup_import_request.id,
+        source_id=setup_import_request.source_id,
+        source_item_id="123",
+        raw_payload=payload,
+        status=ImportItemStatuses.PENDING,
+    )
+    seed_rows(db, item)
+    db.expire_all()
+
+    assert db.get(ImportRequestItem, item.id).raw_payload == payload
+
+
+def test_json_serializer_falls_back_for_big_integers():
+    """Test that integers over 64 bits are serialized like json.dumps does."""
+    assert json_serializer({"id": 2**70}) == '{"id": 1180591620717411303424}'
+
+
+def test_json_serializer_rejects_datetimes():
+    """Test that datetimes still raise instead of being silently serialized."""
+    with pytest.raises(TypeError):
+        json_serializer({"at": datetime.now(timezone.utc)})
+
+
+def test_json_serializer_writes_nan_as_null():
+    """Test that NaN is written as null, which JSONB accepts."""
+    assert json_serializer({"value": math.nan}) == '{"value":null}'
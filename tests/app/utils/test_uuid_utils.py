@@ -0,0 +1,19 @@
+from uuid import uuid4
+
+from app.utils.uuid_utils import is_valid_uuid
+
+
+def test_is_valid_uuid_accepts_canonical_uuid():
+    """Test that canonical UUID strings are accepted in any case."""
+    value = str(uuid4())
+    assert is_valid_uuid(value)
+    assert is_valid_uuid(value.upper())
+
+
+def test_is_valid_uuid_rejects_malformed_values():
+    """Test that malformed or non-canonical strings are rejected."""
+    assert not is_valid_uuid("")
+    assert not is_valid_uuid("not-a-uuid")
+    assert not is_valid_uuid(uuid4().hex)
+    assert not is_valid_uuid(f"{uuid4()}0")
+    assert not is_valid_uuid("g" * 8 + "-0000-0000-0000-" + "0" * 12)
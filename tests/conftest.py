@@ -1,4 +1,15 @@
-from app.config import get_settings
+import os
+from app.config import DEFAULT_TEST_DATABASE_URL, get_settings
+
+# Tests never commit (see db_connection), so pytest-xdist workers only need
+# their own database to run side by side. This has to run before app.db
+# creates its engine and before the settings below read TEST_DATABASE_URL.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _xdist_worker:
+    os.environ["TEST_DATABASE_URL"] = (
+        os.getenv("TEST_DATABASE_URL", DEFAULT_TEST_DATABASE_URL) + f"_{_xdist_worker}"
+    )
+
 import pytest
 import logging
 from fastapi.testclient import TestClient
@@ -6,7 +17,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from fastapi import Request
 from fastapi.security import HTTPAuthorizationCredentials
-from app.db import get_db
+from app.db import JSON_ENGINE_OPTIONS, get_db
 from app.main import create_app
 from starlette.middleware.base import BaseHTTPMiddleware
 from alembic import command
@@ -34,13 +45,23 @@ pytest_plugins = [
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
+TEST_DATABASE_NAME = settings.database_url_obj.database
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--reuse-db",
+        action="store_true",
+        default=False,
+        help="Keep the test database after the run so the next one can reuse it.",
+    )
 
 
 def ensure_test_database():
     """Ensure the test database exists."""
 
     # Connect to default postgres database
-    default_url = settings.database_url.replace("/chrona_test", "/postgres")
+    default_url = settings.database_url.replace(f"/{TEST_DATABASE_NAME}", "/postgres")
     engine = create_engine(default_url, isolation_level="AUTOCOMMIT")
     conn = engine.connect()
 
@@ -48,11 +69,12 @@ def ensure_test_database():
 
     # Check if test database exists
     result = conn.execute(
-        text("SELECT 1 FROM pg_database WHERE datname = 'chrona_test'")
+        text("SELECT 1 FROM pg_database WHERE datname = :name"),
+        {"name": TEST_DATABASE_NAME},
     )
     if not result.scalar():
         logger.debug("Creating test database...")
-        conn.execute(text("CREATE DATABASE chrona_test"))
+        conn.execute(text(f'CREATE DATABASE "{TEST_DATABASE_NAME}"'))
     else:
         logger.debug("Test database already exists")
 
@@ -63,7 +85,7 @@ def ensure_test_database():
 def drop_test_database():
     """Drop the test database."""
     # Connect to default postgres database (not the test database)
-    default_url = settings.database_url.replace("/chrona_test", "/postgres")
+    default_url = settings.database_url.replace(f"/{TEST_DATABASE_NAME}", "/postgres")
     engine = create_engine(default_url, isolation_level="AUTOCOMMIT")
     conn = engine.connect()
 
@@ -73,24 +95,27 @@ def drop_test_database():
             """
         SELECT pg_terminate_backend(pid) 
         FROM pg_stat_activity 
-        WHERE datname = 'chrona_test' AND pid <> pg_backend_pid()
+        WHERE datname = :name AND pid <> pg_backend_pid()
     """
-        )
+        ),
+        {"name": TEST_DATABASE_NAME},
     )
 
     # Drop the test database
-    conn.execute(text("DROP DATABASE IF EXISTS chrona_test"))
+    conn.execute(text(f'DROP DATABASE IF EXISTS "{TEST_DATABASE_NAME}"'))
     conn.close()
     engine.dispose()
 
 
 @pytest.fixture(scope="session")
-def engine():
+def engine(request):
+    reuse_db = request.config.getoption("--reuse-db")
+
     # Ensure test database exists
     ensure_test_database()
 
     # Create PostgreSQL engine for testing
-    engine = create_engine(settings.database_url)
+    engine = create_engine(settings.database_url, **JSON_ENGINE_OPTIONS)
 
     logger.debug("Running migrations...")
 
@@ -98,28 +123,62 @@ def engine():
     alembic_cfg = Config("alembic.ini")
     alembic_cfg.set_main_option("sqlalchemy.url", settings.database_url)
 
-    # Run migrations to create tables
+    # Run migrations to create tables. On a reused database this only applies
+    # migrations added since the previous run.
     command.upgrade(alembic_cfg, "head")
     logger.debug("Migrations completed successfully")
 
     yield engine
 
+    engine.dispose()
+
+    # Tests never commit (see db_connection), so a reused database is still
+    # empty and only the schema carries over to the next run.
+    if reuse_db:
+        logger.debug("Keeping test database for reuse")
+        return
+
     logger.debug("Dropping test database...")
     # Drop the entire test database
     drop_test_database()
     logger.debug("Test database dropped successfully")
 
-    engine.dispose()
-
 
-@pytest.fixture(scope="function")
-def db(engine):
-    # Create a new database session for each test
+@pytest.fixture(scope="module")
+def db_connection(engine):
+    # A single connection is shared by every test in a module. Everything
+    # happens inside one outer transaction that is rolled back once the
+    # module is done, so nothing is ever committed to the database.
     connection = engine.connect()
     transaction = connection.begin()
 
+    yield connection
+
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="module")
+def module_db(db_connection):
+    """Session for module-scoped fixtures; its data is visible to every test in the module."""
+    # commit() only releases a SAVEPOINT, the outer transaction stays open
+    Session = sessionmaker(bind=db_connection, join_transaction_mode="create_savepoint")
+    session = Session()
+
+    yield session
+
+    session.close()
+
+
+@pytest.fixture(scope="function")
+def db(db_connection):
+    # Every test runs inside a SAVEPOINT of the module transaction, so
+    # module-scoped fixtures stay in place while the test's own changes
+    # (including calls to commit()) are rolled back afterwards.
+    nested = db_connection.begin_nested()
+
     # bind an individual Session to the connection
-    Session = sessionmaker(bind=connection)
+    Session = sessionmaker(bind=db_connection, join_transaction_mode="create_savepoint")
     session = Session()
 
     yield session
@@ -130,10 +189,8 @@ def db(engine):
     # rollback - everything that happened with the
     # Session above (including calls to commit())
     # is rolled back.
-    transaction.rollback()
-
-    # return connection to the Engine
-    connection.close()
+    if nested.is_active:
+        nested.rollback()
 
 
 @pytest.fixture(scope="function")
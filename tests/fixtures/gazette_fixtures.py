@@ -1,4 +1,5 @@
 import pytest
+from faker import Faker
 from app.models.gazette import Gazette
 from sqlalchemy.orm import Session
 
@@ -65,3 +66,23 @@ def setup_gazette_with_share_key(db: Session, setup_project, faker):
     db.commit()
     db.refresh(gazette)
     return gazette
+
+
+@pytest.fixture(scope="module")
+def module_gazette_with_share_key(module_db: Session, module_project):
+    """Create a gazette with a share key and fixed tags shared by every test in a module."""
+    faker = Faker()
+
+    gazette = Gazette(
+        name=faker.word(),
+        header=faker.sentence(nb_words=4),
+        subheader=faker.sentence(nb_words=6),
+        theme=faker.word(),
+        tags=["tag1", "tag2", "tag3"],
+        labels={"status": "published"},
+        project_id=module_project.id,
+        share_key="test-share-key-123",
+    )
+    module_db.add(gazette)
+    module_db.flush()
+    return gazette
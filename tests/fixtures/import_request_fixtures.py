@@ -1,8 +1,15 @@
 import pytest
+from app.constants.import_constants import ImportRequestStatuses
 from app.models.import_request import ImportRequest
 from app.models.import_request_item import ImportRequestItem
 
 
+def seed_rows(db, *rows):
+    """Insert rows inside one SAVEPOINT, flushed together on exit."""
+    with db.begin_nested():
+        db.add_all(rows)
+
+
 @pytest.fixture
 def setup_import_request(db, setup_user, setup_project, setup_source, faker):
     """Create an import request for testing purposes."""
@@ -13,7 +20,7 @@ def setup_import_request(db, setup_user, setup_project, setup_source, faker):
     import_request = ImportRequest(
         source_id=source.id,
         requested_by_id=user.id,
-        status="pending",
+        status=ImportRequestStatuses.PENDING,
         received_count=faker.random_int(min=0, max=100),
         success_count=0,
         failure_count=0,
@@ -38,7 +45,7 @@ def setup_another_import_request(
     import_request = ImportRequest(
         source_id=setup_source.id,
         requested_by_id=user.id,
-        status="completed",
+        status=ImportRequestStatuses.COMPLETED,
         received_count=faker.random_int(min=1, max=50),
         success_count=faker.random_int(min=1, max=50),
         failure_count=0,
@@ -112,3 +119,20 @@ def setup_import_request_with_items(db, setup_import_request, setup_source, fake
         db.refresh(item)
 
     return setup_import_request, items
+
+
+@pytest.fixture(scope="module")
+def module_import_request(module_db, module_user, module_project, module_source):
+    """Create a pending import request shared by every test in a module."""
+    import_request = ImportRequest(
+        source_id=module_source.id,
+        requested_by_id=module_user.id,
+        status=ImportRequestStatuses.PENDING,
+        received_count=1,
+        success_count=0,
+        failure_count=0,
+        project_id=module_project.id,
+    )
+    module_db.add(import_request)
+    module_db.flush()
+    return import_request
@@ -1,4 +1,5 @@
 import pytest
+from faker import Faker
 from app.models.project import Project
 from sqlalchemy.orm import Session
 
@@ -19,3 +20,18 @@ def setup_project(db: Session, setup_workspace, faker):
     db.commit()
     db.refresh(project)
     return project
+
+
+@pytest.fixture(scope="module")
+def module_project(module_db: Session, module_workspace):
+    """Create a test project shared by every test in a module."""
+    faker = Faker()
+
+    project = Project(
+        name=faker.company(),
+        description=faker.text(100),
+        workspace_id=module_workspace.id,
+    )
+    module_db.add(project)
+    module_db.flush()
+    return project
@@ -1,4 +1,5 @@
 import pytest
+from faker import Faker
 from app.models.source import Source
 
 
@@ -19,3 +20,19 @@ def setup_source(db, setup_workspace, faker):
     db.commit()
     db.refresh(source)
     return source
+
+
+@pytest.fixture(scope="module")
+def module_source(module_db, module_workspace):
+    """Create a test source shared by every test in a module."""
+    faker = Faker()
+
+    source = Source(
+        name=faker.word(),
+        description=faker.text(100),
+        identifier=str(faker.uuid4()),
+        workspace_id=module_workspace.id,
+    )
+    module_db.add(source)
+    module_db.flush()
+    return source
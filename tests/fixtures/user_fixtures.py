@@ -1,4 +1,5 @@
 import pytest
+from faker import Faker
 from app.models.user import User
 
 
@@ -66,3 +67,25 @@ def setup_another_user(db, faker):
     db.refresh(user)
 
     return user
+
+
+@pytest.fixture(scope="module")
+def module_user(module_db):
+    """Create a test user shared by every test in a module."""
+    faker = Faker()
+    email = faker.email()
+
+    user_data = {
+        "email": email,
+        "username": email,
+        "first_name": faker.first_name(),
+        "last_name": faker.last_name(),
+        "provider": "google",
+        "external_id": str(faker.uuid4()),
+    }
+
+    user = User(**user_data)
+    module_db.add(user)
+    module_db.flush()
+
+    return user
@@ -1,4 +1,5 @@
 import pytest
+from faker import Faker
 from app.constants.membership import MembershipRoles
 from app.models.membership import Membership
 from app.models.workspace import Workspace
@@ -48,3 +49,28 @@ def setup_different_workspace(db, setup_another_user, faker):
     db.commit()
     db.refresh(workspace)
     return workspace
+
+
+@pytest.fixture(scope="module")
+def module_workspace(module_db, module_user):
+    """Create a test workspace, owned by module_user, shared by every test in a module."""
+    faker = Faker()
+    user = module_user
+
+    workspace = Workspace(
+        name=faker.name(),
+        description=faker.text(100),
+        created_by_id=user.id,
+    )
+    module_db.add(workspace)
+    module_db.flush()
+
+    membership = Membership(
+        user_id=user.id,
+        workspace_id=workspace.id,
+        role=MembershipRoles.OWNER,
+        created_by_id=user.id,
+    )
+    module_db.add(membership)
+    module_db.flush()
+    return workspace
@@ -25,3 +25,12 @@ def test_database_connection_with_engine():
             assert result.scalar() == 1
     except Exception as e:
         pytest.fail(f"Database connection failed: {str(e)}")
+
+
+def test_db_fixture_commit_does_not_end_test_transaction(db, db_connection):
+    """Test that commit() in a test only releases a SAVEPOINT and never really commits."""
+    db.execute(text("SELECT 1"))
+    db.commit()
+
+    assert db_connection.in_transaction()
+    assert db_connection.in_nested_transaction()